@@ -9,62 +9,147 @@ Usage:
 """
 
 import argparse
+import collections.abc
 import csv
 import os
-import subprocess
-import math
+import re
+import stat
+import sys
+import threading
 from datetime import datetime
-from typing import Dict, Any, List, Optional, TextIO
+from functools import lru_cache, partial
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Mapping, NamedTuple, Optional, TextIO, Tuple
 
 
 # -------------------- Helpers -------------------- #
 
-def clean_line(line: bytes) -> str:
+# Set AMBER_DEBUG=1 to include full tracebacks in error logs.
+DEBUG = os.environ.get("AMBER_DEBUG") == "1"
+
+# Serializes log output while MST devices are collected from worker threads.
+_LOG_LOCK = threading.Lock()
+
+# Upper bound on concurrent mlxlink collections.
+_MAX_COLLECT_WORKERS = 8
+
+# Upper bound on input files processed in parallel.
+_MAX_FILE_WORKERS = 8
+
+# Translation table used to blank out embedded NULs in decoded CSV text.
+_NUL_TRANS = str.maketrans("\x00", " ")
+
+# Column names read for every row, built once instead of per call.
+_HIST_KEYS = tuple(f"hist{i}" for i in range(16))
+_RAW_BER_LANE_KEYS = tuple(f"Raw_BER_lane{i}" for i in range(4))
+_SNR_MEDIA_KEYS = tuple(f"snr_media_lane{i}" for i in range(4))
+_SNR_HOST_KEYS = tuple(f"snr_host_lane{i}" for i in range(4))
+
+
+def clean_line(line: str) -> str:
     """
-    Decode a line from the CSV and remove NUL bytes.
+    Replace NULs in a line of already-decoded CSV text with spaces.
     amBER CSVs sometimes contain embedded NULs which break csv.reader.
+    Files are opened with errors="replace", so decoding happens once
+    at the file layer and this is a single translate() pass.
     """
-    line = line.replace(b"\x00", b" ")
-    try:
-        return line.decode("utf-8", errors="replace")
-    except Exception:
-        return line.decode("latin1", errors="replace")
+    # Most lines are clean; the `in` scan avoids building a copy for them.
+    if "\x00" in line:
+        return line.translate(_NUL_TRANS)
+    return line
+
+
+class CsvRow(collections.abc.Mapping):
+    """
+    Read-only mapping over one CSV record, keyed through the header index
+    shared by every row of the file. Behaves like a csv.DictReader row
+    (missing trailing fields read as None) without building a dict per row.
+    """
+
+    __slots__ = ("_values", "_index")
+
+    def __init__(self, values: List[str], index: Dict[str, int]) -> None:
+        self._values = values
+        self._index = index
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        i = self._index.get(key)
+        if i is None:
+            return default
+        return self._values[i] if i < len(self._values) else None
+
+    def __getitem__(self, key: Any) -> Optional[str]:
+        i = self._index[key]
+        return self._values[i] if i < len(self._values) else None
 
+    def __contains__(self, key: Any) -> bool:
+        return key in self._index
 
-def read_csv_safely(path: str) -> List[Dict[str, Any]]:
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[List[str], Dict[str, int]]]:
+        # Explicit, so rows still pickle into pool workers when compiled
+        return (CsvRow, (self._values, self._index))
+
+
+def iter_csv_rows(path: str) -> Iterator[CsvRow]:
+    """
+    Lazily yield rows from a CSV file that may contain NUL bytes or odd encodings.
+    Lines are decoded and scrubbed one at a time, so only one row is held in memory.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace", newline="", buffering=1 << 20) as f:
+        reader = csv.reader(map(clean_line, f))
+        header = next(reader, None)
+        if header is None:
+            return
+        index = {name: i for i, name in enumerate(header)}
+        for values in reader:
+            # Skip empty lines
+            if not any(v.strip() for v in values):
+                continue
+            yield CsvRow(values, index)
+
+
+def read_csv_safely(path: str) -> List[CsvRow]:
     """
     Read a CSV file that may contain NUL bytes or odd encodings.
-    Returns a list of dict rows.
+    Returns a list of CsvRow mappings.
     """
-    with open(path, "rb") as f:
-        cleaned_lines = [clean_line(l) for l in f]
-
-    reader = csv.DictReader(cleaned_lines)
-    rows: List[Dict[str, Any]] = []
-    for row in reader:
-        # Skip empty lines
-        if not any(str(v).strip() for v in row.values()):
-            continue
-        rows.append(row)
-    return rows
+    return list(iter_csv_rows(path))
 
 
-def safe_get(row: Dict[str, Any], key: str, default: str = "N/A") -> str:
+def safe_get(row: Mapping[str, Any], key: str, default: str = "N/A") -> str:
     """Return row[key] if present and non-empty, else default."""
-    v = row.get(key, "")
+    v = row.get(key)
     if v is None:
         return default
-    s = str(v).strip()
-    return s if s else default
+    if v.__class__ is not str:
+        v = str(v)
+    if not v:
+        return default
+    # CSV values are rarely padded; only strip (and allocate) when they are
+    if v[0].isspace() or v[-1].isspace():
+        v = v.strip()
+    return v if v else default
 
 
-def safe_float(val: str, default: Optional[float] = None) -> Optional[float]:
+def safe_float(val: Any, default: Optional[float] = None) -> Optional[float]:
     try:
         return float(val)
     except Exception:
         return default
 
 
+def safe_int(val: Any, default: int = 0) -> int:
+    try:
+        return int(val)
+    except Exception:
+        return default
+
+
 def scientific_str(val: Optional[float]) -> str:
     """
     Compact scientific notation for floats; returns 'N/A' if val is None.
@@ -73,9 +158,12 @@ def scientific_str(val: Optional[float]) -> str:
         return "N/A"
     if val == 0:
         return "0"
-    exp = int(math.floor(math.log10(abs(val))))
-    mant = val / (10 ** exp)
-    return f"{mant:.2f}e{exp:+d}"
+    # Let the C formatter pick mantissa/exponent, then drop exponent padding
+    s = f"{val:.2e}"
+    mant, sep, exp = s.partition("e")
+    if not sep:
+        return s  # inf / nan
+    return f"{mant}e{int(exp):+d}"
 
 
 def format_large_number(num: int) -> str:
@@ -92,23 +180,27 @@ def format_large_number(num: int) -> str:
         return f"{num / 1_000_000_000:.1f}B"
 
 
-def summarize_histogram(row: Dict[str, Any]) -> str:
+def parse_histogram(row: Mapping[str, Any]) -> List[int]:
     """
-    Summarize hist0..hist15 into a short text line:
+    Parse hist0..hist15 into a list of 16 ints; unparsable bins count as 0.
+    The per-bin fallback only runs when some bin is not a plain integer.
+    """
+    try:
+        return [int(row.get(key) or 0) for key in _HIST_KEYS]
+    except (TypeError, ValueError):
+        return [safe_int(row.get(key)) for key in _HIST_KEYS]
+
+
+def format_histogram_summary(counts: List[int], total: Optional[int] = None) -> str:
+    """
+    Summarize parsed hist0..hist15 counts into a short text line:
     - total corrections
     - first few bins
     - highest bin with non-zero count
+    Pass `total` when the caller has already summed the counts.
     """
-    counts: List[int] = []
-    for i in range(16):
-        key = f"hist{i}"
-        v = safe_get(row, key, "0")
-        try:
-            counts.append(int(v))
-        except Exception:
-            counts.append(0)
-
-    total = sum(counts)
+    if total is None:
+        total = sum(counts)
     nonzero_bins = [i for i, c in enumerate(counts) if c > 0]
 
     if total == 0 or not nonzero_bins:
@@ -124,7 +216,7 @@ def summarize_histogram(row: Dict[str, Any]) -> str:
     )
 
 
-def classify_link_health(row: Dict[str, Any]) -> str:
+def classify_link_health(row: Mapping[str, Any]) -> str:
     """
     Rough heuristic based on Raw_BER and Effective_BER.
     This is only a human-friendly hint, NOT vendor-official logic.
@@ -132,9 +224,14 @@ def classify_link_health(row: Dict[str, Any]) -> str:
     raw_ber_str = safe_get(row, "Raw_BER", "")
     eff_ber_str = safe_get(row, "Effective_BER", "")
 
-    raw_ber = safe_float(raw_ber_str)
-    eff_ber = safe_float(eff_ber_str)
+    return classify_ber(safe_float(raw_ber_str), safe_float(eff_ber_str))
+
 
+def classify_ber(raw_ber: Optional[float], eff_ber: Optional[float]) -> str:
+    """
+    Same heuristic as classify_link_health(), for BER values the caller
+    has already parsed (None when missing or unparsable).
+    """
     if raw_ber is None and eff_ber is None:
         return "Unknown: BER fields missing or unparsable – check full CSV."
 
@@ -161,19 +258,89 @@ def classify_link_health(row: Dict[str, Any]) -> str:
 
 def log_msg(msg: str, logf: Optional[TextIO]) -> None:
     """Print to stdout and also write to log file if provided."""
-    print(msg)
-    if logf is not None:
-        logf.write(msg + "\n")
+    with _LOG_LOCK:
+        print(msg)
+        if logf is not None:
+            # Two writes into the buffered file are cheaper than building msg + "\n"
+            logf.write(msg)
+            logf.write("\n")
+
+
+def log_lines(lines: List[str], logf: Optional[TextIO]) -> None:
+    """Like log_msg() for several messages, with one print and one file write."""
+    if not lines:
+        return
+    text = "\n".join(lines)
+    with _LOG_LOCK:
+        print(text)
+        if logf is not None:
+            logf.write(text)
+            logf.write("\n")
+
+
+# One `ip -o link` record: index, ifname, <FLAGS>, optional state, link/ether MAC
+_IP_LINK_RE = re.compile(
+    r"^\d+:\s+(\S+?):\s+<([^>]*)>(?:.*?\sstate\s+(\S+))?.*?\slink/ether\s+([0-9a-f:]{17})\b",
+    re.IGNORECASE,
+)
+
+# Netlink constants used when reading links through pyroute2
+_ARPHRD_ETHER = 1
+_IFF_UP = 0x1
+_IFF_LOWER_UP = 0x10000
 
 
+@lru_cache(maxsize=1)
 def get_local_if_map() -> Dict[str, Dict[str, str]]:
     """
     Build a mapping:
         mac_str (e.g. '9c:63:c0:03:58:d0') ->
             {'ifname': 'enp180s0f0np0', 'state': 'UP'}
 
-    Uses `ip -o link`. Best-effort; returns {} if ip is unavailable.
+    Queries netlink directly via pyroute2 when it is installed and falls
+    back to `ip -o link` otherwise. Best-effort; returns {} if neither works.
+
+    The result is cached for the life of the process; call
+    get_local_if_map.cache_clear() to force a fresh lookup.
     """
+    try:
+        from pyroute2 import IPRoute  # type: ignore[import-not-found]
+    except ImportError:
+        return _get_local_if_map_ip()
+
+    try:
+        return _get_local_if_map_netlink(IPRoute)
+    except Exception:
+        return _get_local_if_map_ip()
+
+
+def _get_local_if_map_netlink(iproute_cls: Any) -> Dict[str, Dict[str, str]]:
+    """Build the MAC -> interface map from RTM_GETLINK (no subprocess)."""
+    mapping: Dict[str, Dict[str, str]] = {}
+    with iproute_cls() as ipr:
+        for link in ipr.get_links():
+            # Only Ethernet links, matching `link/ether` in the ip output
+            if link["ifi_type"] != _ARPHRD_ETHER:
+                continue
+            mac = link.get_attr("IFLA_ADDRESS")
+            ifname = link.get_attr("IFLA_IFNAME")
+            if not mac or not ifname:
+                continue
+
+            # Same precedence as the text parser: link flags first,
+            # then the explicit operational state if it is a known value.
+            state = "UP" if link["flags"] & (_IFF_UP | _IFF_LOWER_UP) else "UNKNOWN"
+            oper_state = link.get_attr("IFLA_OPERSTATE")
+            if oper_state in ("UP", "DOWN", "UNKNOWN"):
+                state = oper_state
+
+            mapping[mac.lower()] = {"ifname": ifname, "state": state}
+    return mapping
+
+
+def _get_local_if_map_ip() -> Dict[str, Dict[str, str]]:
+    """Build the MAC -> interface map by parsing `ip -o link` output."""
+    import subprocess
     try:
         out = subprocess.check_output(["ip", "-o", "link"], text=True, stderr=subprocess.DEVNULL)
     except Exception:
@@ -181,25 +348,30 @@ def get_local_if_map() -> Dict[str, Dict[str, str]]:
 
     mapping: Dict[str, Dict[str, str]] = {}
     
-    # Join lines that are split by backslash continuation
-    full_lines = []
-    current_line = ""
-    for line in out.splitlines():
-        line = line.rstrip()
-        # Remove backslash continuation and join
-        if line.endswith("\\"):
-            current_line += line[:-1] + " "
-        else:
-            current_line += line
-            if current_line.strip():
-                full_lines.append(current_line.strip())
-            current_line = ""
-    
+    # `-o` prints one record per line; join any backslash continuations anyway
+    full_lines = out.replace("\\\n", " ").splitlines()
+
     # Process each complete line
     for line in full_lines:
         if not line:
             continue
 
+        m = _IP_LINK_RE.match(line)
+        if m:
+            ifname, flags, explicit_state, mac = m.groups()
+            flag_set = flags.split(",")
+            if "UP" in flag_set or "LOWER_UP" in flag_set:
+                state = "UP"
+            elif "DOWN" in flag_set:
+                state = "DOWN"
+            else:
+                state = "UNKNOWN"
+            if explicit_state and explicit_state.upper() in ("UP", "DOWN", "UNKNOWN"):
+                state = explicit_state.upper()
+            mapping[mac.lower()] = {"ifname": ifname, "state": state}
+            continue
+
+        # Fall back to token scanning for lines the regex does not recognise
         current_ifname = None
         current_state = "UNKNOWN"
         mac = None
@@ -257,203 +429,235 @@ def get_local_if_map() -> Dict[str, Dict[str, str]]:
     return mapping
 
 
+@lru_cache(maxsize=1024)
 def mac_from_amber_hex(amber_mac: str) -> Optional[str]:
     """
-    Convert amBER MAC string like '0x9c63c00358d0' to '9c:63:c0:03:58:d0'.
+    Convert amBER MAC string like '0x9c63c00358d0' to '9c:63:c0:03:58:d0'
+    (always lowercase, like the get_local_if_map() keys).
     Returns None if format is unexpected.
+    Results are cached since the same MAC repeats across sweeps.
     """
     s = amber_mac.strip().lower()
     if s.startswith("0x"):
         s = s[2:]
-    if len(s) != 12 or any(c not in "0123456789abcdef" for c in s):
+    if len(s) != 12:
+        return None
+    # Exactly 6 bytes means 12 hex digits with no embedded whitespace
+    try:
+        if len(bytes.fromhex(s)) != 6:
+            return None
+    except ValueError:
         return None
     return ":".join(s[i:i + 2] for i in range(0, 12, 2))
 
 
 # -------------------- Reporting -------------------- #
 
-def summarize_row(
-    row: Dict[str, Any],
+# Field groups for the optional raw-data dump (--all-fields)
+_FIELD_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "Port & Protocol": ("Port_Number", "MAC_Address", "Protocol", "Speed_[Gb/s]", "Active_FEC"),
+    "Link Status": ("Link_Down", "Link_Down_GB_host", "Link_Down_GB_line", "Time_since_last_clear_[Min]"),
+    "BER Metrics": ("Raw_BER",) + _RAW_BER_LANE_KEYS + ("Effective_BER",),
+    "FEC Histogram": _HIST_KEYS,
+    "SNR": _SNR_MEDIA_KEYS + _SNR_HOST_KEYS,
+    "Cable/Module": ("Cable_PN", "Cable_SN", "cable_technology", "cable_type", "cable_vendor",
+                     "cable_length", "vendor_name", "Module_Temperature", "Module_Voltage"),
+    "Link Events": ("successful_recovery_events", "total_successful_recovery_events",
+                    "unintentional_link_down_events", "intentional_link_down_events",
+                    "local_reason_opcode", "down_blame"),
+}
+_CATEGORY_FLAT = frozenset(f for fields in _FIELD_CATEGORIES.values() for f in fields)
+
+
+# Row count from which summarize_rows() formats reports in a process pool;
+# below it, worker start-up costs more than it saves.
+_PARALLEL_ROW_THRESHOLD = 64
+_MAX_REPORT_WORKERS = 8
+
+# Cleared inside per-file pool workers so they don't start nested row pools.
+_ROW_POOL_ENABLED = True
+
+
+# Fixed part of the per-row report; filled from a dict of preformatted strings.
+_ROW_TEMPLATE = """\
+{rule}
+amBER Link Health Report
+Generated: {timestamp}
+File: {filename}
+Row: {idx}
+{rule}
+
+[Link / Protocol]
+  Port                        : {port}
+  MAC Address (amBER)         : {mac_hex}
+  MAC Address (parsed)        : {mac_addr}
+  Host interface (if found)   : {host_if} (state={host_if_state})
+  Protocol                    : {protocol}
+  Speed [Gb/s]                : {speed_gbps}
+  Active FEC                  : {active_fec}
+  Link Down Count             : {link_down}
+  Link Down (GB host / line)  : {link_down_gb_host} / {link_down_gb_line}
+  Time since last clear [min] : {time_since_clear}
+
+[BER / FEC Metrics]
+  Raw BER lanes 0–3           : {raw_ber_lanes}
+  Raw BER (aggregate)         : {raw_ber_str} ({raw_ber_fmt})
+  Effective BER               : {eff_ber_str} ({eff_ber_fmt})
+  FEC Histogram summary       : {hist_summary}
+
+  [Detailed FEC Histogram (all 16 bins)]
+{hist_detail}
+
+[SNR (if available)]
+  Media lanes 0–3             : {snr_media}
+  Host  lanes 0–3             : {snr_host}
+
+[Cable / Module]
+  Cable PN                    : {cable_pn}
+  Cable SN                    : {cable_sn}
+  Cable technology            : {cable_tech}
+  Cable type                  : {cable_type}
+  Vendor                      : {vendor_display}
+  Length                      : {cable_length}
+  Module temperature          : {module_temp}
+  Module voltage              : {module_vcc}
+
+[Link Events / Recovery]
+  Successful recovery events  : {succ_recovery}
+  Total successful recoveries : {total_recovery}
+  Unintentional link-downs    : {unintent_down}
+  Intentional link-downs      : {intent_down}
+  Last down blame             : {down_blame}
+  Last local reason opcode    : {last_down_reason}
+
+{rule}
+[SUMMARY / VERDICT]
+{rule}
+  Status: {verdict}
+
+  Quick Reference:
+    • Port: {port}
+    • Interface: {host_if} ({host_if_state})
+    • Speed: {speed_gbps} Gb/s
+    • Raw BER: {raw_ber_fmt}
+    • Effective BER: {eff_ber_fmt}
+    • Link Downs: {link_down}
+
+[Grep-Friendly Headline]
+  PORT={port} IF={host_if} IF_STATE={host_if_state} MAC={mac_addr} SPEED={speed_gbps}G \
+LINK_DOWNS={link_down} RAW_BER={raw_ber_fmt} EFF_BER={eff_ber_fmt} VERDICT='{verdict}'
+
+{rule}
+[Additional Statistics]
+{rule}"""
+
+
+def format_row_report(
+    row: Mapping[str, Any],
     filename: str,
     idx: int,
-    logf: TextIO,
     if_map: Dict[str, Dict[str, str]],
-) -> None:
+    all_fields: bool = False,
+) -> str:
     """
-    Print and log a human-readable summary for one CSV row.
+    Build the human-readable summary for one CSV row and return it as text.
+    With all_fields, every non-empty CSV field is appended as raw data.
     """
+    out: List[str] = []
 
     def both(msg: str = "") -> None:
-        log_msg(msg, logf)
-
-    # Get timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    both("=" * 80)
-    both(f"amBER Link Health Report")
-    both(f"Generated: {timestamp}")
-    both(f"File: {filename}")
-    both(f"Row: {idx}")
-    both("=" * 80)
+        out.append(msg)
 
     # Link / protocol
     port              = safe_get(row, "Port_Number")
     mac_hex           = safe_get(row, "MAC_Address")
     mac_addr          = mac_from_amber_hex(mac_hex) or "N/A"
-    protocol          = safe_get(row, "Protocol")
     speed_gbps        = safe_get(row, "Speed_[Gb/s]")
-    active_fec        = safe_get(row, "Active_FEC")
     link_down         = safe_get(row, "Link_Down")
-    link_down_gb_host = safe_get(row, "Link_Down_GB_host")
-    link_down_gb_line = safe_get(row, "Link_Down_GB_line")
     time_since_clear  = safe_get(row, "Time_since_last_clear_[Min]")
 
     # Map MAC -> local interface (if running on same host)
     host_if = "N/A"
     host_if_state = "N/A"
     if mac_addr != "N/A":
-        info = if_map.get(mac_addr.lower())
+        info = if_map.get(mac_addr)
         if info:
             host_if = info.get("ifname", "N/A")
             host_if_state = info.get("state", "N/A")
 
-    both("\n[Link / Protocol]")
-    both(f"  Port                        : {port}")
-    both(f"  MAC Address (amBER)         : {mac_hex}")
-    both(f"  MAC Address (parsed)        : {mac_addr}")
-    both(f"  Host interface (if found)   : {host_if} (state={host_if_state})")
-    both(f"  Protocol                    : {protocol}")
-    both(f"  Speed [Gb/s]                : {speed_gbps}")
-    both(f"  Active FEC                  : {active_fec}")
-    both(f"  Link Down Count             : {link_down}")
-    both(f"  Link Down (GB host / line)  : {link_down_gb_host} / {link_down_gb_line}")
-    both(f"  Time since last clear [min] : {time_since_clear}")
-
     # BER / FEC
     raw_ber_str = safe_get(row, "Raw_BER")
     eff_ber_str = safe_get(row, "Effective_BER")
     raw_ber_val = safe_float(raw_ber_str)
     eff_ber_val = safe_float(eff_ber_str)
 
-    raw_ber_lane0 = safe_get(row, "Raw_BER_lane0")
-    raw_ber_lane1 = safe_get(row, "Raw_BER_lane1")
-    raw_ber_lane2 = safe_get(row, "Raw_BER_lane2")
-    raw_ber_lane3 = safe_get(row, "Raw_BER_lane3")
-
-    both("\n[BER / FEC Metrics]")
-    both(f"  Raw BER lanes 0–3           : {raw_ber_lane0}, {raw_ber_lane1}, {raw_ber_lane2}, {raw_ber_lane3}")
-    both(
-        f"  Raw BER (aggregate)         : {raw_ber_str} "
-        f"({scientific_str(raw_ber_val)})"
-    )
-    both(
-        f"  Effective BER               : {eff_ber_str} "
-        f"({scientific_str(eff_ber_val)})"
-    )
+    # Parsed once for both the summary line and the breakdown
+    hist_counts = parse_histogram(row)
+    total_corrections = sum(hist_counts)
 
-    hist_summary = summarize_histogram(row)
-    both(f"  FEC Histogram summary       : {hist_summary}")
-    
     # Full FEC Histogram breakdown
-    both("\n  [Detailed FEC Histogram (all 16 bins)]")
-    hist_counts: List[int] = []
-    for i in range(16):
-        key = f"hist{i}"
-        v = safe_get(row, key, "0")
-        try:
-            count = int(v)
-            hist_counts.append(count)
-        except Exception:
-            hist_counts.append(0)
-    
-    total_corrections = sum(hist_counts)
     if total_corrections > 0:
-        for i, count in enumerate(hist_counts):
-            percentage = (count / total_corrections * 100) if total_corrections > 0 else 0
-            both(f"    Bin {i:2d}: {format_large_number(count):>8s} ({count:>15,}) - {percentage:5.2f}%")
+        pct_scale = 100.0 / total_corrections
+        hist_detail = "\n".join(
+            f"    Bin {i:2d}: {format_large_number(count):>8s} ({count:>15,}) - {count * pct_scale:5.2f}%"
+            for i, count in enumerate(hist_counts)
+        )
     else:
-        both("    All bins are zero (no FEC corrections)")
-
-    # SNR (if present)
-    snr_media = [safe_get(row, f"snr_media_lane{i}", "N/A") for i in range(4)]
-    snr_host  = [safe_get(row, f"snr_host_lane{i}", "N/A") for i in range(4)]
-
-    both("\n[SNR (if available)]")
-    both(f"  Media lanes 0–3             : {', '.join(snr_media)}")
-    both(f"  Host  lanes 0–3             : {', '.join(snr_host)}")
+        hist_detail = "    All bins are zero (no FEC corrections)"
 
     # Cable / module
-    cable_pn      = safe_get(row, "Cable_PN")
-    cable_sn      = safe_get(row, "Cable_SN")
-    cable_tech    = safe_get(row, "cable_technology")
-    cable_type    = safe_get(row, "cable_type")
     cable_vendor  = safe_get(row, "cable_vendor")
-    cable_length  = safe_get(row, "cable_length")
-    vendor_name   = safe_get(row, "vendor_name")
     module_temp   = safe_get(row, "Module_Temperature")
     module_vcc    = safe_get(row, "Module_Voltage")
 
-    vendor_display = cable_vendor if cable_vendor != "N/A" else vendor_name
-
-    both("\n[Cable / Module]")
-    both(f"  Cable PN                    : {cable_pn}")
-    both(f"  Cable SN                    : {cable_sn}")
-    both(f"  Cable technology            : {cable_tech}")
-    both(f"  Cable type                  : {cable_type}")
-    both(f"  Vendor                      : {vendor_display}")
-    both(f"  Length                      : {cable_length}")
-    both(f"  Module temperature          : {module_temp}")
-    both(f"  Module voltage              : {module_vcc}")
-
-    # Link events / recovery
-    succ_recovery  = safe_get(row, "successful_recovery_events")
-    total_recovery = safe_get(row, "total_successful_recovery_events")
-    unintent_down  = safe_get(row, "unintentional_link_down_events")
-    intent_down    = safe_get(row, "intentional_link_down_events")
-    last_down_reason = safe_get(row, "local_reason_opcode")
-    down_blame       = safe_get(row, "down_blame")
-
-    both("\n[Link Events / Recovery]")
-    both(f"  Successful recovery events  : {succ_recovery}")
-    both(f"  Total successful recoveries : {total_recovery}")
-    both(f"  Unintentional link-downs    : {unintent_down}")
-    both(f"  Intentional link-downs      : {intent_down}")
-    both(f"  Last down blame             : {down_blame}")
-    both(f"  Last local reason opcode    : {last_down_reason}")
-
-    # Verdict
-    verdict = classify_link_health(row)
-    both("\n" + "=" * 80)
-    both("[SUMMARY / VERDICT]")
-    both("=" * 80)
-    both(f"  Status: {verdict}")
-    both("")
-    both("  Quick Reference:")
-    both(f"    • Port: {port}")
-    both(f"    • Interface: {host_if} ({host_if_state})")
-    both(f"    • Speed: {speed_gbps} Gb/s")
-    both(f"    • Raw BER: {scientific_str(raw_ber_val)}")
-    both(f"    • Effective BER: {scientific_str(eff_ber_val)}")
-    both(f"    • Link Downs: {link_down}")
-    both("")
-
-    # One-line headline for grep-friendly logs
-    both("[Grep-Friendly Headline]")
-    both(
-        "  "
-        f"PORT={port} "
-        f"IF={host_if} IF_STATE={host_if_state} "
-        f"MAC={mac_addr} SPEED={speed_gbps}G "
-        f"LINK_DOWNS={link_down} "
-        f"RAW_BER={scientific_str(raw_ber_val)} "
-        f"EFF_BER={scientific_str(eff_ber_val)} "
-        f"VERDICT='{verdict}'"
-    )
-    # Additional Statistics and Calculations
-    both("\n" + "=" * 80)
-    both("[Additional Statistics]")
-    both("=" * 80)
-    
+    vendor_display = cable_vendor if cable_vendor != "N/A" else safe_get(row, "vendor_name")
+
+    # Everything up to the additional statistics is rendered in one pass
+    verdict = classify_ber(raw_ber_val, eff_ber_val)
+    view = {
+        "rule": "=" * 80,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "filename": filename,
+        "idx": idx,
+        "port": port,
+        "mac_hex": mac_hex,
+        "mac_addr": mac_addr,
+        "host_if": host_if,
+        "host_if_state": host_if_state,
+        "protocol": safe_get(row, "Protocol"),
+        "speed_gbps": speed_gbps,
+        "active_fec": safe_get(row, "Active_FEC"),
+        "link_down": link_down,
+        "link_down_gb_host": safe_get(row, "Link_Down_GB_host"),
+        "link_down_gb_line": safe_get(row, "Link_Down_GB_line"),
+        "time_since_clear": time_since_clear,
+        "raw_ber_lanes": ", ".join(safe_get(row, key) for key in _RAW_BER_LANE_KEYS),
+        "raw_ber_str": raw_ber_str,
+        "raw_ber_fmt": scientific_str(raw_ber_val),
+        "eff_ber_str": eff_ber_str,
+        "eff_ber_fmt": scientific_str(eff_ber_val),
+        "hist_summary": format_histogram_summary(hist_counts, total_corrections),
+        "hist_detail": hist_detail,
+        "snr_media": ", ".join(safe_get(row, key, "N/A") for key in _SNR_MEDIA_KEYS),
+        "snr_host": ", ".join(safe_get(row, key, "N/A") for key in _SNR_HOST_KEYS),
+        "cable_pn": safe_get(row, "Cable_PN"),
+        "cable_sn": safe_get(row, "Cable_SN"),
+        "cable_tech": safe_get(row, "cable_technology"),
+        "cable_type": safe_get(row, "cable_type"),
+        "vendor_display": vendor_display,
+        "cable_length": safe_get(row, "cable_length"),
+        "module_temp": module_temp,
+        "module_vcc": module_vcc,
+        "succ_recovery": safe_get(row, "successful_recovery_events"),
+        "total_recovery": safe_get(row, "total_successful_recovery_events"),
+        "unintent_down": safe_get(row, "unintentional_link_down_events"),
+        "intent_down": safe_get(row, "intentional_link_down_events"),
+        "down_blame": safe_get(row, "down_blame"),
+        "last_down_reason": safe_get(row, "local_reason_opcode"),
+        "verdict": verdict,
+    }
+    both(_ROW_TEMPLATE.format_map(view))
+
     # Calculate FEC correction rate if time is available
     time_min = safe_float(time_since_clear)
     if time_min and time_min > 0 and total_corrections > 0:
@@ -517,259 +721,342 @@ def summarize_row(
         except Exception:
             pass
     
-    # All Available CSV Fields (for completeness)
-    both("\n" + "=" * 80)
-    both("[All Available CSV Fields (Raw Data)]")
-    both("=" * 80)
-    both("  The following fields were found in the CSV (some may be empty):")
-    both("")
-    
-    # Group fields by category for better readability
-    field_categories = {
-        "Port & Protocol": ["Port_Number", "MAC_Address", "Protocol", "Speed_[Gb/s]", "Active_FEC"],
-        "Link Status": ["Link_Down", "Link_Down_GB_host", "Link_Down_GB_line", "Time_since_last_clear_[Min]"],
-        "BER Metrics": ["Raw_BER", "Raw_BER_lane0", "Raw_BER_lane1", "Raw_BER_lane2", "Raw_BER_lane3", 
-                       "Effective_BER"],
-        "FEC Histogram": [f"hist{i}" for i in range(16)],
-        "SNR": [f"snr_media_lane{i}" for i in range(4)] + [f"snr_host_lane{i}" for i in range(4)],
-        "Cable/Module": ["Cable_PN", "Cable_SN", "cable_technology", "cable_type", "cable_vendor", 
-                        "cable_length", "vendor_name", "Module_Temperature", "Module_Voltage"],
-        "Link Events": ["successful_recovery_events", "total_successful_recovery_events",
-                       "unintentional_link_down_events", "intentional_link_down_events",
-                       "local_reason_opcode", "down_blame"]
-    }
-    
-    displayed_fields = set()
-    for category, fields in field_categories.items():
-        category_fields = []
-        for field in fields:
-            if field in row:
-                displayed_fields.add(field)
-                value = safe_get(row, field, "")
-                if value != "N/A" and value.strip():
-                    category_fields.append(f"    {field:40s} : {value}")
-        
-        if category_fields:
-            both(f"  [{category}]")
-            for line in category_fields:
-                both(line)
-            both("")
-    
-    # Show any remaining fields not in categories
-    remaining_fields = [k for k in row.keys() if k not in displayed_fields and safe_get(row, k, "").strip() and safe_get(row, k, "") != "N/A"]
-    if remaining_fields:
-        both("  [Other Fields]")
-        for field in sorted(remaining_fields):
+    # All Available CSV Fields (for completeness), only with --all-fields
+    if all_fields:
+        both("\n" + "=" * 80)
+        both("[All Available CSV Fields (Raw Data)]")
+        both("=" * 80)
+        both("  The following fields were found in the CSV (some may be empty):")
+        both("")
+
+        for category, fields in _FIELD_CATEGORIES.items():
+            category_fields = []
+            for field in fields:
+                if field in row:
+                    value = safe_get(row, field, "")
+                    if value != "N/A" and value.strip():
+                        category_fields.append(f"    {field:40s} : {value}")
+
+            if category_fields:
+                both(f"  [{category}]")
+                for line in category_fields:
+                    both(line)
+                both("")
+
+        # Show any remaining fields not in categories
+        remaining_fields = []
+        for field in frozenset(row) - _CATEGORY_FLAT:
             value = safe_get(row, field, "")
             if value and value != "N/A":
+                remaining_fields.append((field, value))
+        if remaining_fields:
+            both("  [Other Fields]")
+            for field, value in sorted(remaining_fields):
                 both(f"    {field:40s} : {value}")
-        both("")
+            both("")
     
     both("")  # spacing
 
+    return "\n".join(out) + "\n"
+
 
-def find_csv_files_in_directory(directory: str, max_results: int = 10) -> List[str]:
-    """Find CSV files in a directory."""
+def _format_indexed_row(
+    item: Tuple[int, Mapping[str, Any]],
+    filename: str,
+    if_map: Dict[str, Dict[str, str]],
+    all_fields: bool,
+) -> str:
+    """Process-pool entry point: format_row_report() for an (idx, row) pair."""
+    idx, row = item
+    return format_row_report(row, filename, idx, if_map, all_fields)
+
+
+def _write_report(text: str, logf: Optional[TextIO]) -> None:
+    """Write one preformatted report to stdout and the log file."""
+    with _LOG_LOCK:
+        sys.stdout.write(text)
+        if logf is not None:
+            logf.write(text)
+
+
+def summarize_row(
+    row: Mapping[str, Any],
+    filename: str,
+    idx: int,
+    logf: TextIO,
+    if_map: Dict[str, Dict[str, str]],
+    all_fields: bool = False,
+) -> None:
+    """
+    Print and log a human-readable summary for one CSV row.
+    The report is built in memory and written once to stdout and the log.
+    """
+    _write_report(format_row_report(row, filename, idx, if_map, all_fields), logf)
+
+
+def summarize_rows(
+    rows: List[CsvRow],
+    filename: str,
+    logf: TextIO,
+    if_map: Dict[str, Dict[str, str]],
+    all_fields: bool = False,
+) -> None:
+    """
+    Print and log summaries for all rows of a file, in row order.
+    Large files are formatted across a process pool (rows are independent);
+    the parent stays the only writer. Falls back to sequential formatting
+    if the pool cannot be used.
+    """
+    workers = min(os.cpu_count() or 1, _MAX_REPORT_WORKERS)
+    if _ROW_POOL_ENABLED and len(rows) >= _PARALLEL_ROW_THRESHOLD and workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        render = partial(_format_indexed_row, filename=filename, if_map=if_map, all_fields=all_fields)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                reports = list(ex.map(render, enumerate(rows), chunksize=max(1, len(rows) // (workers * 4))))
+        except Exception:
+            reports = None
+        if reports is not None:
+            for text in reports:
+                _write_report(text, logf)
+            return
+
+    for i, row in enumerate(rows):
+        summarize_row(row, filename, i, logf, if_map, all_fields)
+
+
+def find_csv_files_in_directory(directory: str, max_results: int = 10, max_entries: int = 1000) -> List[str]:
+    """Find CSV files in a directory, looking at no more than max_entries entries."""
     csv_files = []
     try:
-        if os.path.isdir(directory):
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                if os.path.isfile(item_path) and item.lower().endswith('.csv'):
-                    csv_files.append(item_path)
-                if len(csv_files) >= max_results:
+        # DirEntry caches the type from the directory read, so is_file()
+        # normally needs no extra stat() per entry.
+        with os.scandir(directory) as it:
+            for n, entry in enumerate(it, 1):
+                if entry.name[-4:].lower() == ".csv" and entry.is_file():
+                    csv_files.append(entry.path)
+                if len(csv_files) >= max_results or n >= max_entries:
                     break
     except Exception as e:
-        # Silently fail - directory might not be accessible
+        # Silently fail - directory might not exist or be accessible
         pass
     return sorted(csv_files)
 
 
+# Standard amBER CSV columns (based on typical amBER output)
+_TEMPLATE_COLUMNS = (
+    "amBer_Version", "TimeStamp", "Iteration/Sweep", "Test_Description",
+    "collection_tool", "collection_tool_version", "MAC_Address", "Port_Number",
+    "Label_cage", "Phy_Manager_State", "Protocol", "Speed_[Gb/s]",
+    "Ethernet_Protocol_Active", "Link_Down", "successful_recovery_events",
+    "Raw_BER_lane0", "Raw_BER_lane1", "Raw_BER_lane2", "Raw_BER_lane3",
+    "Raw_BER_lane4", "Raw_BER_lane5", "Raw_BER_lane6", "Raw_BER_lane7",
+    "Link_Down_GB_host", "Link_Down_GB_line", "Active_FEC",
+    "USR-T_Link_Down", "USR-M_Link_Down", "Time_since_last_clear_[Min]",
+    "Conf_Level_Raw_BER", "Raw_BER", "Effective_BER", "FC_Zero_Hist",
+    "Number_of_histogram_bins", "bin0_high_value", "bin0_low_value",
+    "bin1_high_value", "bin1_low_value", "bin2_high_value", "bin2_low_value",
+    "bin3_high_value", "bin3_low_value", "bin4_high_value", "bin4_low_value",
+    "bin5_high_value", "bin5_low_value", "bin6_high_value", "bin6_low_value",
+    "bin7_high_value", "bin7_low_value", "bin8_high_value", "bin8_low_value",
+    "bin9_high_value", "bin9_low_value", "bin10_high_value", "bin10_low_value",
+    "bin11_high_value", "bin11_low_value", "bin12_high_value", "bin12_low_value",
+    "bin13_high_value", "bin13_low_value", "bin14_high_value", "bin14_low_value",
+    "bin15_high_value", "bin15_low_value", "hist0", "hist1", "hist2", "hist3",
+    "hist4", "hist5", "hist6", "hist7", "hist8", "hist9", "hist10", "hist11",
+    "hist12", "hist13", "hist14", "hist15", "Raw_Errors_lane0", "Raw_Errors_lane1",
+    "Raw_Errors_lane2", "Raw_Errors_lane3", "Raw_Errors_lane4", "Raw_Errors_lane5",
+    "Raw_Errors_lane6", "Raw_Errors_lane7", "Effective_Errors", "Symbol_Errors",
+    "module_oper_status", "module_error_type", "ethernet_compliance_code",
+    "ext_ethernet_compliance_code", "Memory_map_rev", "Vendor_OUI", "Cable_PN",
+    "Cable_SN", "cable_technology", "linear_direct_drive", "cable_breakout",
+    "cable_type", "cable_vendor", "cable_length", "smf_length", "cable_identifier",
+    "cable_power_class", "max_power", "cable_rx_amp", "cable_rx_pre_emphasis",
+    "cable_rx_post_emphasis", "cable_tx_equalization", "cable_attenuation_53g",
+    "cable_attenuation_25g", "cable_attenuation_12g", "cable_attenuation_7g",
+    "cable_attenuation_5g", "tx_input_freq_sync", "rx_cdr_cap", "tx_cdr_cap",
+    "rx_cdr_state", "tx_cdr_state", "vendor_name", "vendor_rev", "module_fw_version",
+    "rx_power_lane_0", "rx_power_lane_1", "rx_power_lane_2", "rx_power_lane_3",
+    "rx_power_lane_4", "rx_power_lane_5", "rx_power_lane_6", "rx_power_lane_7",
+    "tx_power_lane_0", "tx_power_lane_1", "tx_power_lane_2", "tx_power_lane_3",
+    "tx_power_lane_4", "tx_power_lane_5", "tx_power_lane_6", "tx_power_lane_7",
+    "tx_bias_lane_0", "tx_bias_lane_1", "tx_bias_lane_2", "tx_bias_lane_3",
+    "tx_bias_lane_4", "tx_bias_lane_5", "tx_bias_lane_6", "tx_bias_lane_7",
+    "temperature_high_th", "temperature_low_th", "voltage_high_th", "voltage_low_th",
+    "rx_power_high_th", "rx_power_low_th", "tx_power_high_th", "tx_power_low_th",
+    "tx_bias_high_th", "tx_bias_low_th", "wavelength", "wavelength_tolerance",
+    "Module_st", "Dp_st_lane0", "Dp_st_lane1", "Dp_st_lane2", "Dp_st_lane3",
+    "Dp_st_lane4", "Dp_st_lane5", "Dp_st_lane6", "Dp_st_lane7", "rx_output_valid",
+    "Nominal_Bit_Rate", "Rx_Power_Type", "Date_Code", "Module_Temperature",
+    "Module_Voltage", "Active_set_host_compliance_code", "Active_set_media_compliance_code",
+    "error_code_response", "Temp_flags", "Vcc_flags", "Mod_fw_fault", "Dp_fw_fault",
+    "tx_fault", "tx_los", "tx_cdr_lol", "tx_ad_eq_fault", "tx_power_hi_al",
+    "tx_power_lo_al", "tx_power_hi_war", "tx_power_lo_war", "tx_bias_hi_al",
+    "tx_bias_lo_al", "tx_bias_hi_war", "tx_bias_lo_war", "rx_los", "rx_cdr_lol",
+    "rx_power_hi_al", "rx_power_lo_al", "rx_power_hi_war", "rx_power_lo_war",
+    "laser_status", "laser_restriction", "els_oper_state", "els_laser_fault_state",
+    "MCM_system", "Tile_Num", "slot_index", "Module_Lanes_Used", "PLL_Index",
+    "Retimer_valid", "Retimer_dp_num", "Retimer_die_num", "Device_Description",
+    "Device_Part_Number", "Device_FW_Version", "Device_ID", "SerDes_Technology_(16nm/7nm_5nm)",
+    "System_Voltage", "System_Current", "Voltage/Current_sensor_name", "Chip_Temp",
+    "Temp_sensor_name", "Device_SN", "UPHY_version", "BKV_version",
+    "Lane0_pre_3_tap", "Lane1_pre_3_tap", "Lane2_pre_3_tap", "Lane3_pre_3_tap",
+    "Lane4_pre_3_tap", "Lane5_pre_3_tap", "Lane6_pre_3_tap", "Lane7_pre_3_tap",
+    "Lane0_pre_2_tap", "Lane1_pre_2_tap", "Lane2_pre_2_tap", "Lane3_pre_2_tap",
+    "Lane4_pre_2_tap", "Lane5_pre_2_tap", "Lane6_pre_2_tap", "Lane7_pre_2_tap",
+    "Lane0_pre_1_tap", "Lane1_pre_1_tap", "Lane2_pre_1_tap", "Lane3_pre_1_tap",
+    "Lane4_pre_1_tap", "Lane5_pre_1_tap", "Lane6_pre_1_tap", "Lane7_pre_1_tap",
+    "Lane0_main_tap", "Lane1_main_tap", "Lane2_main_tap", "Lane3_main_tap",
+    "Lane4_main_tap", "Lane5_main_tap", "Lane6_main_tap", "Lane7_main_tap",
+    "Lane0_post_1_tap", "Lane1_post_1_tap", "Lane2_post_1_tap", "Lane3_post_1_tap",
+    "Lane4_post_1_tap", "Lane5_post_1_tap", "Lane6_post_1_tap", "Lane7_post_1_tap",
+    "Advanced_Status_Opcode", "Status_Message", "eth_an_fsm_state", "ib_phy_fsm_state",
+    "phy_manager_link_enabled", "core_to_phy_link_enabled", "cable_proto_cap",
+    "loopback_mode", "fec_mode_request", "profile_fec_in_use", "up_reason_pwr",
+    "up_reason_drv", "up_reason_mng", "time_to_link_up_msec", "fast_link_up_status",
+    "time_to_link_up_phy_up_to_active", "time_to_link_up_sd_to_phy_up",
+    "time_to_link_up_disable_to_sd", "time_to_link_up_disable_to_pd",
+    "time_of_module_conf_done_up", "time_of_module_conf_done_down",
+    "time_logical_init_to_active", "down_blame", "local_reason_opcode",
+    "remote_reason_opcode", "e2e_reason_opcode", "time_to_link_down_to_disable",
+    "time_to_link_down_to_rx_loss", "num_of_raw_ber_alarms", "num_of_symbol_ber_alarms",
+    "num_of_eff_ber_alarms", "last_raw_ber", "last_eff_ber", "last_symbol_ber",
+    "max_raw_ber", "max_effective_ber", "max_symbol_ber", "min_raw_ber",
+    "min_effective_ber", "min_symbol_ber", "snr_media_lane0", "snr_media_lane1",
+    "snr_media_lane2", "snr_media_lane3", "snr_media_lane4", "snr_media_lane5",
+    "snr_media_lane6", "snr_media_lane7", "snr_host_lane0", "snr_host_lane1",
+    "snr_host_lane2", "snr_host_lane3", "snr_host_lane4", "snr_host_lane5",
+    "snr_host_lane6", "snr_host_lane7", "voltage_pemi", "module_st_pemi",
+    "rx_power_lane0_pemi", "rx_power_lane1_pemi", "rx_power_lane2_pemi",
+    "rx_power_lane3_pemi", "rx_power_lane4_pemi", "rx_power_lane5_pemi",
+    "rx_power_lane6_pemi", "rx_power_lane7_pemi", "tx_power_lane0_pemi",
+    "tx_power_lane1_pemi", "tx_power_lane2_pemi", "tx_power_lane3_pemi",
+    "tx_power_lane4_pemi", "tx_power_lane5_pemi", "tx_power_lane6_pemi",
+    "tx_power_lane7_pemi", "tx_bias_lane0_pemi", "tx_bias_lane1_pemi",
+    "tx_bias_lane2_pemi", "tx_bias_lane3_pemi", "tx_bias_lane4_pemi",
+    "tx_bias_lane5_pemi", "tx_bias_lane6_pemi", "tx_bias_lane7_pemi",
+    "dp_st_lane0_pemi", "dp_st_lane1_pemi", "dp_st_lane2_pemi", "dp_st_lane3_pemi",
+    "dp_st_lane4_pemi", "dp_st_lane5_pemi", "dp_st_lane6_pemi", "dp_st_lane7_pemi",
+    "oe_ts1_temperature", "els_ts1_temperature", "laser_frequency_error_lane0",
+    "laser_frequency_error_lane1", "laser_frequency_error_lane2",
+    "laser_frequency_error_lane3", "laser_frequency_error_lane4",
+    "laser_frequency_error_lane5", "laser_frequency_error_lane6",
+    "laser_frequency_error_lane7", "cooled_laser_temperature_lane0",
+    "cooled_laser_temperature_lane1", "cooled_laser_temperature_lane2",
+    "cooled_laser_temperature_lane3", "cooled_laser_temperature_lane4",
+    "cooled_laser_temperature_lane5", "cooled_laser_temperature_lane6",
+    "cooled_laser_temperature_lane7", "icc_monitor", "els_power_consumption",
+    "pre_fec_ber_min_media", "pre_fec_ber_min_host", "pre_fec_ber_max_media",
+    "pre_fec_ber_max_host", "pre_fec_ber_avg_media", "pre_fec_ber_avg_host",
+    "pre_fec_ber_val_media", "pre_fec_ber_val_host", "pre_fec_ber_cap",
+    "temp_threshold_1", "temp_threshold_2", "temp_threshold_3", "temp_threshold_4",
+    "temp_thr_1_counter", "temp_thr_2_counter", "temp_thr_3_counter",
+    "temp_thr_4_counter", "abs_max_temp_change", "operational_recovery",
+    "total_successful_recovery_events", "successful_recovery_events_cnt",
+    "unintentional_link_down_events", "intentional_link_down_events",
+    "time_in_last_host_logical_recovery", "time_in_last_host_serdes_feq_recovery",
+    "time_in_last_module_tx_disable_recovery",
+    "time_in_last_module_datapath_full_toggle_recovery",
+    "total_time_in_host_logical_recovery", "total_time_in_host_serdes_feq_recovery",
+    "total_time_in_module_datapath_full_toggle_recovery",
+    "total_host_logical_recovery_count", "total_host_serdes_feq_recovery_count",
+    "total_module_tx_disable_recovery_count",
+    "total_module_datapath_full_toggle_recovery_count",
+    "total_host_logical_succesful_recovery_count",
+    "total_host_serdes_feq_succesful_recovery_count",
+    "total_module_tx_disable_succesful_recovery_count",
+    "total_module_datapath_full_toggle_succesful_recovery_count",
+    "time_since_last_recovery", "last_host_logical_recovery_attempts_count",
+    "last_host_serdes_feq_attempts_count", "time_between_last_2_recoveries",
+    "last_rs_fec_uncorrectable_during_recovery",
+)
+
+# Header line as csv.writer would emit it (no name needs quoting)
+_TEMPLATE_HEADER = ",".join(_TEMPLATE_COLUMNS) + "\r\n"
+
+# Key columns listed when describing a header-only CSV (in display order)
+_IMPORTANT_COLS = (
+    "MAC_Address", "Port_Number", "Protocol", "Speed_[Gb/s]",
+    "Raw_BER", "Effective_BER", "Link_Down", "Active_FEC",
+    "Cable_PN", "Cable_SN", "Module_Temperature", "Module_Voltage",
+)
+
+# One bit per important column, in _IMPORTANT_COLS order, so the set found in
+# a header is a single int and lowest-bit-first iteration keeps display order
+_IMPORTANT_BIT = {col: 1 << i for i, col in enumerate(_IMPORTANT_COLS)}
+
+
 def create_template_csv(path: str) -> bool:
     """
     Create a template amBER CSV file with all expected columns.
     Returns True if successful, False otherwise.
     """
-    # Standard amBER CSV columns (based on typical amBER output)
-    template_columns = [
-        "amBer_Version", "TimeStamp", "Iteration/Sweep", "Test_Description",
-        "collection_tool", "collection_tool_version", "MAC_Address", "Port_Number",
-        "Label_cage", "Phy_Manager_State", "Protocol", "Speed_[Gb/s]",
-        "Ethernet_Protocol_Active", "Link_Down", "successful_recovery_events",
-        "Raw_BER_lane0", "Raw_BER_lane1", "Raw_BER_lane2", "Raw_BER_lane3",
-        "Raw_BER_lane4", "Raw_BER_lane5", "Raw_BER_lane6", "Raw_BER_lane7",
-        "Link_Down_GB_host", "Link_Down_GB_line", "Active_FEC",
-        "USR-T_Link_Down", "USR-M_Link_Down", "Time_since_last_clear_[Min]",
-        "Conf_Level_Raw_BER", "Raw_BER", "Effective_BER", "FC_Zero_Hist",
-        "Number_of_histogram_bins", "bin0_high_value", "bin0_low_value",
-        "bin1_high_value", "bin1_low_value", "bin2_high_value", "bin2_low_value",
-        "bin3_high_value", "bin3_low_value", "bin4_high_value", "bin4_low_value",
-        "bin5_high_value", "bin5_low_value", "bin6_high_value", "bin6_low_value",
-        "bin7_high_value", "bin7_low_value", "bin8_high_value", "bin8_low_value",
-        "bin9_high_value", "bin9_low_value", "bin10_high_value", "bin10_low_value",
-        "bin11_high_value", "bin11_low_value", "bin12_high_value", "bin12_low_value",
-        "bin13_high_value", "bin13_low_value", "bin14_high_value", "bin14_low_value",
-        "bin15_high_value", "bin15_low_value", "hist0", "hist1", "hist2", "hist3",
-        "hist4", "hist5", "hist6", "hist7", "hist8", "hist9", "hist10", "hist11",
-        "hist12", "hist13", "hist14", "hist15", "Raw_Errors_lane0", "Raw_Errors_lane1",
-        "Raw_Errors_lane2", "Raw_Errors_lane3", "Raw_Errors_lane4", "Raw_Errors_lane5",
-        "Raw_Errors_lane6", "Raw_Errors_lane7", "Effective_Errors", "Symbol_Errors",
-        "module_oper_status", "module_error_type", "ethernet_compliance_code",
-        "ext_ethernet_compliance_code", "Memory_map_rev", "Vendor_OUI", "Cable_PN",
-        "Cable_SN", "cable_technology", "linear_direct_drive", "cable_breakout",
-        "cable_type", "cable_vendor", "cable_length", "smf_length", "cable_identifier",
-        "cable_power_class", "max_power", "cable_rx_amp", "cable_rx_pre_emphasis",
-        "cable_rx_post_emphasis", "cable_tx_equalization", "cable_attenuation_53g",
-        "cable_attenuation_25g", "cable_attenuation_12g", "cable_attenuation_7g",
-        "cable_attenuation_5g", "tx_input_freq_sync", "rx_cdr_cap", "tx_cdr_cap",
-        "rx_cdr_state", "tx_cdr_state", "vendor_name", "vendor_rev", "module_fw_version",
-        "rx_power_lane_0", "rx_power_lane_1", "rx_power_lane_2", "rx_power_lane_3",
-        "rx_power_lane_4", "rx_power_lane_5", "rx_power_lane_6", "rx_power_lane_7",
-        "tx_power_lane_0", "tx_power_lane_1", "tx_power_lane_2", "tx_power_lane_3",
-        "tx_power_lane_4", "tx_power_lane_5", "tx_power_lane_6", "tx_power_lane_7",
-        "tx_bias_lane_0", "tx_bias_lane_1", "tx_bias_lane_2", "tx_bias_lane_3",
-        "tx_bias_lane_4", "tx_bias_lane_5", "tx_bias_lane_6", "tx_bias_lane_7",
-        "temperature_high_th", "temperature_low_th", "voltage_high_th", "voltage_low_th",
-        "rx_power_high_th", "rx_power_low_th", "tx_power_high_th", "tx_power_low_th",
-        "tx_bias_high_th", "tx_bias_low_th", "wavelength", "wavelength_tolerance",
-        "Module_st", "Dp_st_lane0", "Dp_st_lane1", "Dp_st_lane2", "Dp_st_lane3",
-        "Dp_st_lane4", "Dp_st_lane5", "Dp_st_lane6", "Dp_st_lane7", "rx_output_valid",
-        "Nominal_Bit_Rate", "Rx_Power_Type", "Date_Code", "Module_Temperature",
-        "Module_Voltage", "Active_set_host_compliance_code", "Active_set_media_compliance_code",
-        "error_code_response", "Temp_flags", "Vcc_flags", "Mod_fw_fault", "Dp_fw_fault",
-        "tx_fault", "tx_los", "tx_cdr_lol", "tx_ad_eq_fault", "tx_power_hi_al",
-        "tx_power_lo_al", "tx_power_hi_war", "tx_power_lo_war", "tx_bias_hi_al",
-        "tx_bias_lo_al", "tx_bias_hi_war", "tx_bias_lo_war", "rx_los", "rx_cdr_lol",
-        "rx_power_hi_al", "rx_power_lo_al", "rx_power_hi_war", "rx_power_lo_war",
-        "laser_status", "laser_restriction", "els_oper_state", "els_laser_fault_state",
-        "MCM_system", "Tile_Num", "slot_index", "Module_Lanes_Used", "PLL_Index",
-        "Retimer_valid", "Retimer_dp_num", "Retimer_die_num", "Device_Description",
-        "Device_Part_Number", "Device_FW_Version", "Device_ID", "SerDes_Technology_(16nm/7nm_5nm)",
-        "System_Voltage", "System_Current", "Voltage/Current_sensor_name", "Chip_Temp",
-        "Temp_sensor_name", "Device_SN", "UPHY_version", "BKV_version",
-        "Lane0_pre_3_tap", "Lane1_pre_3_tap", "Lane2_pre_3_tap", "Lane3_pre_3_tap",
-        "Lane4_pre_3_tap", "Lane5_pre_3_tap", "Lane6_pre_3_tap", "Lane7_pre_3_tap",
-        "Lane0_pre_2_tap", "Lane1_pre_2_tap", "Lane2_pre_2_tap", "Lane3_pre_2_tap",
-        "Lane4_pre_2_tap", "Lane5_pre_2_tap", "Lane6_pre_2_tap", "Lane7_pre_2_tap",
-        "Lane0_pre_1_tap", "Lane1_pre_1_tap", "Lane2_pre_1_tap", "Lane3_pre_1_tap",
-        "Lane4_pre_1_tap", "Lane5_pre_1_tap", "Lane6_pre_1_tap", "Lane7_pre_1_tap",
-        "Lane0_main_tap", "Lane1_main_tap", "Lane2_main_tap", "Lane3_main_tap",
-        "Lane4_main_tap", "Lane5_main_tap", "Lane6_main_tap", "Lane7_main_tap",
-        "Lane0_post_1_tap", "Lane1_post_1_tap", "Lane2_post_1_tap", "Lane3_post_1_tap",
-        "Lane4_post_1_tap", "Lane5_post_1_tap", "Lane6_post_1_tap", "Lane7_post_1_tap",
-        "Advanced_Status_Opcode", "Status_Message", "eth_an_fsm_state", "ib_phy_fsm_state",
-        "phy_manager_link_enabled", "core_to_phy_link_enabled", "cable_proto_cap",
-        "loopback_mode", "fec_mode_request", "profile_fec_in_use", "up_reason_pwr",
-        "up_reason_drv", "up_reason_mng", "time_to_link_up_msec", "fast_link_up_status",
-        "time_to_link_up_phy_up_to_active", "time_to_link_up_sd_to_phy_up",
-        "time_to_link_up_disable_to_sd", "time_to_link_up_disable_to_pd",
-        "time_of_module_conf_done_up", "time_of_module_conf_done_down",
-        "time_logical_init_to_active", "down_blame", "local_reason_opcode",
-        "remote_reason_opcode", "e2e_reason_opcode", "time_to_link_down_to_disable",
-        "time_to_link_down_to_rx_loss", "num_of_raw_ber_alarms", "num_of_symbol_ber_alarms",
-        "num_of_eff_ber_alarms", "last_raw_ber", "last_eff_ber", "last_symbol_ber",
-        "max_raw_ber", "max_effective_ber", "max_symbol_ber", "min_raw_ber",
-        "min_effective_ber", "min_symbol_ber", "snr_media_lane0", "snr_media_lane1",
-        "snr_media_lane2", "snr_media_lane3", "snr_media_lane4", "snr_media_lane5",
-        "snr_media_lane6", "snr_media_lane7", "snr_host_lane0", "snr_host_lane1",
-        "snr_host_lane2", "snr_host_lane3", "snr_host_lane4", "snr_host_lane5",
-        "snr_host_lane6", "snr_host_lane7", "voltage_pemi", "module_st_pemi",
-        "rx_power_lane0_pemi", "rx_power_lane1_pemi", "rx_power_lane2_pemi",
-        "rx_power_lane3_pemi", "rx_power_lane4_pemi", "rx_power_lane5_pemi",
-        "rx_power_lane6_pemi", "rx_power_lane7_pemi", "tx_power_lane0_pemi",
-        "tx_power_lane1_pemi", "tx_power_lane2_pemi", "tx_power_lane3_pemi",
-        "tx_power_lane4_pemi", "tx_power_lane5_pemi", "tx_power_lane6_pemi",
-        "tx_power_lane7_pemi", "tx_bias_lane0_pemi", "tx_bias_lane1_pemi",
-        "tx_bias_lane2_pemi", "tx_bias_lane3_pemi", "tx_bias_lane4_pemi",
-        "tx_bias_lane5_pemi", "tx_bias_lane6_pemi", "tx_bias_lane7_pemi",
-        "dp_st_lane0_pemi", "dp_st_lane1_pemi", "dp_st_lane2_pemi", "dp_st_lane3_pemi",
-        "dp_st_lane4_pemi", "dp_st_lane5_pemi", "dp_st_lane6_pemi", "dp_st_lane7_pemi",
-        "oe_ts1_temperature", "els_ts1_temperature", "laser_frequency_error_lane0",
-        "laser_frequency_error_lane1", "laser_frequency_error_lane2",
-        "laser_frequency_error_lane3", "laser_frequency_error_lane4",
-        "laser_frequency_error_lane5", "laser_frequency_error_lane6",
-        "laser_frequency_error_lane7", "cooled_laser_temperature_lane0",
-        "cooled_laser_temperature_lane1", "cooled_laser_temperature_lane2",
-        "cooled_laser_temperature_lane3", "cooled_laser_temperature_lane4",
-        "cooled_laser_temperature_lane5", "cooled_laser_temperature_lane6",
-        "cooled_laser_temperature_lane7", "icc_monitor", "els_power_consumption",
-        "pre_fec_ber_min_media", "pre_fec_ber_min_host", "pre_fec_ber_max_media",
-        "pre_fec_ber_max_host", "pre_fec_ber_avg_media", "pre_fec_ber_avg_host",
-        "pre_fec_ber_val_media", "pre_fec_ber_val_host", "pre_fec_ber_cap",
-        "temp_threshold_1", "temp_threshold_2", "temp_threshold_3", "temp_threshold_4",
-        "temp_thr_1_counter", "temp_thr_2_counter", "temp_thr_3_counter",
-        "temp_thr_4_counter", "abs_max_temp_change", "operational_recovery",
-        "total_successful_recovery_events", "successful_recovery_events_cnt",
-        "unintentional_link_down_events", "intentional_link_down_events",
-        "time_in_last_host_logical_recovery", "time_in_last_host_serdes_feq_recovery",
-        "time_in_last_module_tx_disable_recovery",
-        "time_in_last_module_datapath_full_toggle_recovery",
-        "total_time_in_host_logical_recovery", "total_time_in_host_serdes_feq_recovery",
-        "total_time_in_module_datapath_full_toggle_recovery",
-        "total_host_logical_recovery_count", "total_host_serdes_feq_recovery_count",
-        "total_module_tx_disable_recovery_count",
-        "total_module_datapath_full_toggle_recovery_count",
-        "total_host_logical_succesful_recovery_count",
-        "total_host_serdes_feq_succesful_recovery_count",
-        "total_module_tx_disable_succesful_recovery_count",
-        "total_module_datapath_full_toggle_succesful_recovery_count",
-        "time_since_last_recovery", "last_host_logical_recovery_attempts_count",
-        "last_host_serdes_feq_attempts_count", "time_between_last_2_recoveries",
-        "last_rs_fec_uncorrectable_during_recovery"
-    ]
-    
     try:
         # Ensure directory exists
         file_dir = os.path.dirname(os.path.abspath(path))
-        if file_dir and not os.path.exists(file_dir):
+        if file_dir:
             os.makedirs(file_dir, exist_ok=True)
         
         # Write header row
-        with open(path, 'w', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(template_columns)
+        with open(path, 'w', encoding='utf-8', newline='', buffering=1 << 16) as f:
+            f.write(_TEMPLATE_HEADER)
         
         return True
     except Exception as e:
         return False
 
 
-def process_file(path: str, logf: TextIO, if_map: Dict[str, Dict[str, str]]) -> None:
+class ProcessResult(NamedTuple):
+    """What process_file()/process_rows() did with one path, for the run summary."""
+    created: bool = False   # a template was written for a missing path
+    row_count: int = 0
+    had_data: bool = False
+    error: str = ""         # set when the path could not be processed at all
+
+
+def process_file(path: str, logf: TextIO, if_map: Dict[str, Dict[str, str]], all_fields: bool = False) -> ProcessResult:
     # Normalize the path - handle relative paths
     original_path = path
-    if not os.path.isabs(path):
-        # It's a relative path, try current directory first
-        abs_path = os.path.abspath(path)
-        if os.path.exists(abs_path):
-            path = abs_path
-    else:
-        abs_path = path
+    abs_path = path if os.path.isabs(path) else os.path.abspath(path)
+
+    # One stat (following symlinks, like os.path.exists) answers every
+    # "exists / directory / regular file" question below
+    try:
+        st = os.stat(abs_path)
+        path = abs_path
+    except OSError:
+        st = None
     
     # Check if file exists and provide better error messages
-    if not os.path.exists(path):
-        log_msg(f"[ERROR] {original_path}: file does not exist.", logf)
-        log_msg(f"[ERROR] Current directory: {os.getcwd()}", logf)
+    if st is None:
+        # Collected and written in one go; this path can emit dozens of lines
+        lines = [
+            f"[ERROR] {original_path}: file does not exist.",
+            f"[ERROR] Current directory: {os.getcwd()}",
+        ]
         if original_path != abs_path:
-            log_msg(f"[ERROR] Tried absolute path: {abs_path}", logf)
+            lines.append(f"[ERROR] Tried absolute path: {abs_path}")
         
-        # Try to find CSV files in the same directory
+        # Try to find CSV files in the same directory. Suggestions are only
+        # useful to someone watching, so batch runs skip the search entirely.
+        interactive = sys.stderr.isatty()
         file_dir = os.path.dirname(abs_path) if os.path.isabs(original_path) else os.getcwd()
-        csv_files = find_csv_files_in_directory(file_dir)
+        csv_files = find_csv_files_in_directory(file_dir) if interactive else []
         found_any = False
         
         if csv_files:
             found_any = True
-            log_msg(f"[INFO] Found {len(csv_files)} CSV file(s) in {file_dir}:", logf)
+            lines.append(f"[INFO] Found {len(csv_files)} CSV file(s) in {file_dir}:")
             for csv_file in csv_files[:5]:  # Show first 5
                 # Show relative path if in current directory
                 if file_dir == os.getcwd():
                     rel_path = os.path.relpath(csv_file, os.getcwd())
-                    log_msg(f"[INFO]   - {rel_path} (or {csv_file})", logf)
+                    lines.append(f"[INFO]   - {rel_path} (or {csv_file})")
                 else:
-                    log_msg(f"[INFO]   - {csv_file}", logf)
+                    lines.append(f"[INFO]   - {csv_file}")
             if len(csv_files) > 5:
-                log_msg(f"[INFO]   ... and {len(csv_files) - 5} more", logf)
-        else:
+                lines.append(f"[INFO]   ... and {len(csv_files) - 5} more")
+        elif interactive:
             # Search in common locations including current directory
             search_dirs = [os.getcwd(), '/root', '/tmp', '/var/log']
             for search_dir in search_dirs:
@@ -777,58 +1064,65 @@ def process_file(path: str, logf: TextIO, if_map: Dict[str, Dict[str, str]]) ->
                     csv_files = find_csv_files_in_directory(search_dir, max_results=3)
                     if csv_files:
                         if not found_any:
-                            log_msg(f"[INFO] Searching for CSV files in common locations:", logf)
+                            lines.append(f"[INFO] Searching for CSV files in common locations:")
                             found_any = True
-                        log_msg(f"[INFO]   {search_dir}:", logf)
+                        lines.append(f"[INFO]   {search_dir}:")
                         for csv_file in csv_files:
                             # Show relative path if in current directory
                             if search_dir == os.getcwd():
                                 rel_path = os.path.relpath(csv_file, os.getcwd())
-                                log_msg(f"[INFO]     - {rel_path} (or {csv_file})", logf)
+                                lines.append(f"[INFO]     - {rel_path} (or {csv_file})")
                             else:
-                                log_msg(f"[INFO]     - {csv_file}", logf)
+                                lines.append(f"[INFO]     - {csv_file}")
             
             if not found_any:
-                log_msg(f"[INFO] No CSV files found in current directory or common locations.", logf)
-                log_msg(f"[INFO] Searched in: {', '.join(search_dirs)}", logf)
+                lines.append(f"[INFO] No CSV files found in current directory or common locations.")
+                lines.append(f"[INFO] Searched in: {', '.join(search_dirs)}")
         
-        log_msg(f"[ERROR] Please check the file path and try again.", logf)
+        lines.append(f"[ERROR] Please check the file path and try again.")
         if found_any:
-            log_msg(f"[TIP] Try using the full path or one of the files listed above.", logf)
-            log_msg(f"[INFO] Alternatively, creating a template CSV file at {abs_path}...", logf)
-        else:
-            log_msg(f"[TIP] Creating a template CSV file since none were found.", logf)
+            lines.append(f"[TIP] Try using the full path or one of the files listed above.")
+            lines.append(f"[INFO] Alternatively, creating a template CSV file at {abs_path}...")
+        elif interactive:
+            lines.append(f"[TIP] Creating a template CSV file since none were found.")
         
         # Always create the template file for the requested path
-        log_msg(f"[INFO] Creating template CSV file with expected column headers at {abs_path}...", logf)
+        lines.append(f"[INFO] Creating template CSV file with expected column headers at {abs_path}...")
         if create_template_csv(abs_path):
-            log_msg(f"[SUCCESS] Template CSV file created: {abs_path}", logf)
-            log_msg(f"[INFO] This is a template file with column headers only.", logf)
-            log_msg(f"[INFO] You can now populate it with actual amBER data or use it as a reference.", logf)
-            log_msg(f"[INFO] Attempting to process the newly created file...", logf)
-            # Close current log file and reopen to append
-            logf.flush()
+            lines.append(f"[SUCCESS] Template CSV file created: {abs_path}")
+            lines.append(f"[INFO] This is a template file with column headers only.")
+            lines.append(f"[INFO] You can now populate it with actual amBER data or use it as a reference.")
+            lines.append(f"[INFO] Attempting to process the newly created file...")
+            log_lines(lines, logf)
             # Now try to process the newly created file
             try:
-                rows = read_csv_safely(abs_path)
+                # A fresh template is header-only, so peek for a first row
+                # instead of building a row list just to find it empty
+                row_iter = iter_csv_rows(abs_path)
+                first = next(row_iter, None)
+                rows = [] if first is None else [first, *row_iter]
                 if not rows:
-                    log_msg(f"[WARN] {abs_path}: CSV has no data rows (only headers).", logf)
-                    log_msg(f"[INFO] This is expected for a template file. Add data rows to process.", logf)
+                    log_lines([
+                        f"[WARN] {abs_path}: CSV has no data rows (only headers).",
+                        f"[INFO] This is expected for a template file. Add data rows to process.",
+                    ], logf)
                 else:
                     log_msg(f"[INFO] Found {len(rows)} data row(s) in the file.", logf)
-                    for i, row in enumerate(rows):
-                        summarize_row(row, abs_path, i, logf, if_map)
+                    summarize_rows(rows, abs_path, logf, if_map, all_fields)
+                return ProcessResult(created=True, row_count=len(rows), had_data=bool(rows))
             except Exception as e:
                 log_msg(f"[ERROR] Failed to process newly created file: {e}", logf)
+                return ProcessResult(created=True)
         else:
-            log_msg(f"[ERROR] Failed to create template CSV file. Check permissions.", logf)
-        return
+            lines.append(f"[ERROR] Failed to create template CSV file. Check permissions.")
+            log_lines(lines, logf)
+            return ProcessResult(error="file does not exist and a template could not be created")
     
-    if os.path.isdir(path):
+    if stat.S_ISDIR(st.st_mode):
         log_msg(f"[ERROR] {path}: is a directory, not a file.", logf)
-        return
+        return ProcessResult(error="is a directory, not a file")
     
-    if not os.path.isfile(path):
+    if not stat.S_ISREG(st.st_mode):
         # Check if it's a symlink
         if os.path.islink(path):
             real_path = os.path.realpath(path)
@@ -838,26 +1132,49 @@ def process_file(path: str, logf: TextIO, if_map: Dict[str, Dict[str, str]]) ->
                 path = real_path
             else:
                 log_msg(f"[ERROR] Symlink target {real_path} is not a regular file.", logf)
-                return
+                return ProcessResult(error=f"symlink target {real_path} is not a regular file")
         else:
             log_msg(f"[ERROR] {path}: not a regular file, skipping.", logf)
-            return
+            return ProcessResult(error="not a regular file")
 
     try:
         rows = read_csv_safely(path)
     except Exception as e:
         log_msg(f"[ERROR] Failed to read {path}: {e}", logf)
-        import traceback
-        log_msg(f"[ERROR] Traceback: {traceback.format_exc()}", logf)
-        return
+        if DEBUG:
+            import traceback
+            log_msg(f"[ERROR] Traceback: {traceback.format_exc()}", logf)
+        return ProcessResult(error=f"failed to read: {e}")
+
+    return process_rows(rows, path, logf, if_map, all_fields)
 
+
+def process_rows(
+    rows: List[CsvRow],
+    path: str,
+    logf: TextIO,
+    if_map: Dict[str, Dict[str, str]],
+    all_fields: bool = False,
+) -> ProcessResult:
+    """
+    Report on rows already read from `path`. Files with no data rows get a
+    description of their header instead. Used directly for freshly collected
+    files whose rows are already in memory.
+    """
     if not rows:
         log_msg(f"[WARN] {path}: CSV has no valid data rows (only headers or empty).", logf)
         
         # Try to read the header to provide more information
         try:
             with open(path, "rb") as f:
-                first_line = f.readline()
+                file_size = os.fstat(f.fileno()).st_size
+                first_line = ""
+                if file_size:
+                    import mmap
+                    # mmap can't map an empty file; find() scans the page cache without copying
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        nl = mm.find(b"\n")
+                        first_line = mm[:nl if nl >= 0 else mm.size()].decode("utf-8", errors="replace")
                 if first_line:
                     cleaned = clean_line(first_line)
                     if cleaned.strip():
@@ -868,22 +1185,23 @@ def process_file(path: str, logf: TextIO, if_map: Dict[str, Dict[str, str]]) ->
                             if headers:
                                 log_msg(f"[INFO] CSV file structure:", logf)
                                 log_msg(f"[INFO]   Total columns: {len(headers)}", logf)
-                                log_msg(f"[INFO]   File size: {os.path.getsize(path)} bytes", logf)
+                                log_msg(f"[INFO]   File size: {file_size} bytes", logf)
                                 log_msg(f"[INFO]   This appears to be a template file with column headers only.", logf)
                                 log_msg(f"[INFO]   Key columns found:", logf)
                                 
                                 # Show important columns
-                                important_cols = [
-                                    "MAC_Address", "Port_Number", "Protocol", "Speed_[Gb/s]",
-                                    "Raw_BER", "Effective_BER", "Link_Down", "Active_FEC",
-                                    "Cable_PN", "Cable_SN", "Module_Temperature", "Module_Voltage"
-                                ]
-                                found_important = [col for col in important_cols if col in headers]
-                                if found_important:
-                                    for col in found_important[:10]:  # Show first 10
-                                        log_msg(f"[INFO]     - {col}", logf)
-                                    if len(found_important) > 10:
-                                        log_msg(f"[INFO]     ... and {len(found_important) - 10} more important columns", logf)
+                                found_mask = 0
+                                for col in headers:
+                                    found_mask |= _IMPORTANT_BIT.get(col, 0)
+                                found_count = bin(found_mask).count("1")
+                                shown = 0
+                                while found_mask and shown < 10:  # Show first 10
+                                    low = found_mask & -found_mask
+                                    log_msg(f"[INFO]     - {_IMPORTANT_COLS[low.bit_length() - 1]}", logf)
+                                    found_mask ^= low
+                                    shown += 1
+                                if found_count > 10:
+                                    log_msg(f"[INFO]     ... and {found_count - 10} more important columns", logf)
                                 
                                 log_msg(f"[INFO]   To process this file, add data rows below the header row.", logf)
                         except Exception:
@@ -891,23 +1209,46 @@ def process_file(path: str, logf: TextIO, if_map: Dict[str, Dict[str, str]]) ->
         except Exception:
             pass
         
-        return
+        return ProcessResult()
 
-    for i, row in enumerate(rows):
-        summarize_row(row, path, i, logf, if_map)
+    summarize_rows(rows, path, logf, if_map, all_fields)
+    return ProcessResult(row_count=len(rows), had_data=True)
 
 
 # -------------------- Main -------------------- #
 
+_IF_MAP_MSG = "[INFO] Found %d local interface(s) for MAC mapping."
+
+
 def expand_file_patterns(patterns: List[str]) -> List[str]:
     """Expand wildcard patterns to actual file paths."""
+    import fnmatch
     import glob
     expanded = []
+    # Directory listings already read, keyed by the literal directory part
+    listings: Dict[str, List[str]] = {}
     for pattern in patterns:
         # Check if pattern contains wildcards
         if '*' in pattern or '?' in pattern or '[' in pattern:
             # Expand glob patterns
-            matches = glob.glob(pattern)
+            dir_part, name_part = os.path.split(pattern)
+            if not name_part or "**" in pattern or any(c in dir_part for c in "*?["):
+                matches = glob.glob(pattern)
+            else:
+                # Wildcards only in the last component: list that directory once
+                # with scandir and match names directly. Like glob, hide
+                # dotfiles unless asked.
+                names = listings.get(dir_part)
+                if names is None:
+                    try:
+                        with os.scandir(dir_part or ".") as it:
+                            names = [e.name for e in it]
+                    except OSError:
+                        names = []
+                    listings[dir_part] = names
+                if not name_part.startswith("."):
+                    names = [n for n in names if not n.startswith(".")]
+                matches = [os.path.join(dir_part, n) for n in fnmatch.filter(names, name_part)]
             if matches:
                 expanded.extend(sorted(matches))
             else:
@@ -919,22 +1260,26 @@ def expand_file_patterns(patterns: List[str]) -> List[str]:
     return expanded
 
 
+def _output_text(data: Optional[bytes]) -> str:
+    """Decode captured subprocess output for logging."""
+    return data.decode("utf-8", errors="replace") if data else ""
+
+
 def check_mst_installed() -> bool:
     """Check if MST (mst command) is installed."""
-    try:
-        result = subprocess.run(["which", "mst"], capture_output=True, text=True)
-        return result.returncode == 0
-    except Exception:
-        return False
+    import shutil
+    return shutil.which("mst") is not None
 
 
 def install_mst() -> bool:
     """Install MST (Mellanox Firmware Tools) from Mellanox website."""
-    import tempfile
     import shutil
+    import subprocess
+    import tarfile
+    import tempfile
+    import urllib.request
     
     mst_url = "https://www.mellanox.com/downloads/MFT/mft-4.33.0-169-x86_64-deb.tgz"
-    mst_tgz = "mft-4.33.0-169-x86_64-deb.tgz"
     mst_dir = "mft-4.33.0-169-x86_64-deb"
     
     log_msg("[INFO] Installing MST (Mellanox Firmware Tools)...", None)
@@ -948,24 +1293,24 @@ def install_mst() -> bool:
         temp_dir = tempfile.mkdtemp(prefix="mst_install_")
         os.chdir(temp_dir)
         
-        # Download
+        # Download and extract in one pass: the archive is unpacked as it
+        # streams in, so the .tgz never touches the disk
         log_msg("[INFO] Downloading MST package (this may take a few minutes)...", None)
-        result = subprocess.run(["wget", mst_url], capture_output=True, text=True, timeout=600)
-        if result.returncode != 0:
-            log_msg(f"[ERROR] Failed to download MST.", None)
-            if result.stderr:
-                log_msg(f"[ERROR] {result.stderr}", None)
-            return False
-        
-        if not os.path.exists(mst_tgz):
-            log_msg("[ERROR] Downloaded file not found.", None)
-            return False
-        
-        # Extract
         log_msg("[INFO] Extracting MST package...", None)
-        result = subprocess.run(["tar", "-xvf", mst_tgz], capture_output=True, text=True, timeout=60)
-        if result.returncode != 0:
-            log_msg(f"[ERROR] Failed to extract MST: {result.stderr}", None)
+        try:
+            with urllib.request.urlopen(mst_url, timeout=600) as resp:
+                with tarfile.open(fileobj=resp, mode="r|gz") as tar:
+                    if hasattr(tarfile, "data_filter"):
+                        tar.extractall(path=temp_dir, filter="data")
+                    else:
+                        tar.extractall(path=temp_dir)
+        except tarfile.TarError as e:
+            log_msg(f"[ERROR] Failed to extract MST: {e}", None)
+            return False
+        except OSError as e:
+            # URLError, timeouts and connection resets are all OSError
+            log_msg(f"[ERROR] Failed to download MST.", None)
+            log_msg(f"[ERROR] {e}", None)
             return False
         
         if not os.path.exists(mst_dir):
@@ -976,42 +1321,43 @@ def install_mst() -> bool:
         log_msg("[INFO] Installing MST packages...", None)
         os.chdir(mst_dir)
         
-        # Check for install script first
+        # Check for install script first (result stays None without one)
+        result: Optional[subprocess.CompletedProcess[bytes]] = None
         if os.path.exists("install.sh"):
             log_msg("[INFO] Running install.sh...", None)
-            result = subprocess.run(["bash", "install.sh"], capture_output=True, text=True, timeout=300)
+            result = subprocess.run(["bash", "install.sh"], capture_output=True, timeout=300)
             if result.returncode == 0:
                 log_msg("[SUCCESS] MST installed successfully.", None)
                 return True
             else:
                 # Try with sudo
                 log_msg("[INFO] Trying with sudo...", None)
-                result = subprocess.run(["sudo", "bash", "install.sh"], capture_output=True, text=True, timeout=300)
+                result = subprocess.run(["sudo", "bash", "install.sh"], capture_output=True, timeout=300)
         
         # If no install script or it failed, try installing .deb files directly
-        if result.returncode != 0 or not os.path.exists("install.sh"):
+        if result is None or result.returncode != 0:
             deb_files = [f for f in os.listdir(".") if f.endswith(".deb")]
             if deb_files:
                 log_msg(f"[INFO] Found {len(deb_files)} .deb file(s), installing...", None)
                 for deb_file in sorted(deb_files):
                     log_msg(f"[INFO] Installing {deb_file}...", None)
-                    result = subprocess.run(["sudo", "dpkg", "-i", deb_file], capture_output=True, text=True, timeout=300)
+                    result = subprocess.run(["sudo", "dpkg", "-i", deb_file], capture_output=True, timeout=300)
                     if result.returncode != 0:
                         # Try to fix dependencies
                         log_msg("[INFO] Fixing dependencies...", None)
-                        subprocess.run(["sudo", "apt-get", "install", "-f", "-y"], capture_output=True, text=True, timeout=300)
-                        result = subprocess.run(["sudo", "dpkg", "-i", deb_file], capture_output=True, text=True, timeout=300)
+                        subprocess.run(["sudo", "apt-get", "install", "-f", "-y"], capture_output=True, timeout=300)
+                        result = subprocess.run(["sudo", "dpkg", "-i", deb_file], capture_output=True, timeout=300)
             else:
                 log_msg("[ERROR] No install script or .deb files found", None)
                 return False
         
-        if result.returncode == 0:
+        if result is not None and result.returncode == 0:
             log_msg("[SUCCESS] MST installed successfully.", None)
             return True
         else:
             log_msg(f"[ERROR] Installation failed.", None)
-            if result.stderr:
-                log_msg(f"[ERROR] {result.stderr}", None)
+            if result is not None and result.stderr:
+                log_msg(f"[ERROR] {_output_text(result.stderr)}", None)
             return False
             
     except subprocess.TimeoutExpired:
@@ -1019,8 +1365,9 @@ def install_mst() -> bool:
         return False
     except Exception as e:
         log_msg(f"[ERROR] Failed to install MST: {e}", None)
-        import traceback
-        log_msg(f"[ERROR] Traceback: {traceback.format_exc()}", None)
+        if DEBUG:
+            import traceback
+            log_msg(f"[ERROR] Traceback: {traceback.format_exc()}", None)
         return False
     finally:
         # Cleanup
@@ -1034,29 +1381,20 @@ def install_mst() -> bool:
 
 def check_mst_running() -> bool:
     """Check if MST (Mellanox Software Tools) is running."""
-    mst_dir = "/dev/mst"
-    if not os.path.exists(mst_dir):
-        return False
-    
     # Check if there are any MST devices
     try:
-        items = os.listdir(mst_dir)
-        for item in items:
-            if item.startswith("mt") and "pciconf" in item:
-                device_path = os.path.join(mst_dir, item)
-                if os.path.exists(device_path):
-                    return True
-    except Exception:
-        pass
-    
-    return False
+        with os.scandir("/dev/mst") as it:
+            return any(e.name.startswith("mt") and "pciconf" in e.name for e in it)
+    except OSError:
+        return False
 
 
 def start_mst() -> bool:
     """Start MST (Mellanox Software Tools) driver."""
+    import subprocess
     try:
         log_msg("[INFO] Starting MST (Mellanox Software Tools)...", None)
-        result = subprocess.run(["mst", "start"], capture_output=True, text=True, timeout=30)
+        result = subprocess.run(["mst", "start"], capture_output=True, timeout=30)
         
         if result.returncode == 0:
             log_msg("[SUCCESS] MST started successfully.", None)
@@ -1065,7 +1403,7 @@ def start_mst() -> bool:
             time.sleep(2)
             return True
         else:
-            log_msg(f"[ERROR] Failed to start MST: {result.stderr}", None)
+            log_msg(f"[ERROR] Failed to start MST: {_output_text(result.stderr)}", None)
             return False
     except FileNotFoundError:
         log_msg("[ERROR] 'mst' command not found. Please install Mellanox Firmware Tools (MFT).", None)
@@ -1080,78 +1418,87 @@ def start_mst() -> bool:
 
 def find_all_mst_devices() -> List[str]:
     """Find all MST devices in /dev/mst/. Returns empty list if MST not running."""
-    devices = []
-    mst_dir = "/dev/mst"
-    if os.path.exists(mst_dir):
-        for item in os.listdir(mst_dir):
-            if item.startswith("mt") and "pciconf" in item:
-                device_path = os.path.join(mst_dir, item)
-                if os.path.exists(device_path):
-                    devices.append(device_path)
-    return sorted(devices)
-
-
-def get_link_name_from_csv(csv_file: str) -> str:
-    """Extract link/port name from CSV file to use in filename."""
     try:
-        rows = read_csv_safely(csv_file)
-        if rows:
-            # Get port number from first row
-            port = safe_get(rows[0], "Port_Number", "")
-            # Clean port name for filename (remove special chars)
-            if port:
-                port_clean = port.replace("(", "_").replace(")", "").replace("/", "_").replace(" ", "_")
-                return port_clean
-    except Exception:
-        pass
+        with os.scandir("/dev/mst") as it:
+            return sorted(e.path for e in it if e.name.startswith("mt") and "pciconf" in e.name)
+    except OSError:
+        return []
+
+
+def get_link_name_from_row(row: Mapping[str, Any]) -> str:
+    """Extract link/port name from a CSV row (usually the first) to use in filename."""
+    port = safe_get(row, "Port_Number", "")
+    # Clean port name for filename (remove special chars)
+    if port:
+        port_clean = port.replace("(", "_").replace(")", "").replace("/", "_").replace(" ", "_")
+        return port_clean
     return ""
 
 
-def get_interface_name_from_csv(csv_file: str, if_map: Dict[str, Dict[str, str]]) -> str:
-    """Extract interface name from CSV file using MAC address mapping."""
-    try:
-        rows = read_csv_safely(csv_file)
-        if rows:
-            # Get MAC address from first row
-            mac_hex = safe_get(rows[0], "MAC_Address", "")
-            mac_addr = mac_from_amber_hex(mac_hex)
-            if mac_addr and mac_addr.lower() in if_map:
-                ifname = if_map[mac_addr.lower()].get("ifname", "")
-                if ifname:
-                    return ifname
-    except Exception:
-        pass
+def get_interface_name_from_row(row: Mapping[str, Any], if_map: Dict[str, Dict[str, str]]) -> str:
+    """Extract interface name from a CSV row using MAC address mapping."""
+    mac_hex = safe_get(row, "MAC_Address", "")
+    mac_addr = mac_from_amber_hex(mac_hex)
+    # mac_from_amber_hex() yields lowercase, matching the if_map keys
+    entry = if_map.get(mac_addr) if mac_addr else None
+    if entry:
+        return entry.get("ifname", "")
     return ""
 
 
 def capture_kernel_messages(output_file: str) -> str:
     """Capture kernel messages (dmesg) with timestamps to a file."""
-    kernel_log_file = output_file.replace(".csv", "_kernel.log")
+    import shutil
+    import subprocess
+    base_name = os.path.splitext(output_file)[0]
+    kernel_log_file = base_name + "_kernel.log"
+    temp_file = base_name + "_kernel_temp.log"
+    if os.path.abspath(kernel_log_file) == os.path.abspath(output_file):
+        log_msg(f"[ERROR] Kernel log would overwrite {output_file}; not capturing.", None)
+        return ""
     
+    if shutil.which("dmesg") is None:
+        log_msg("[ERROR] dmesg command not found.", None)
+        return ""
+
     try:
         log_msg(f"[INFO] Capturing kernel messages to: {kernel_log_file}", None)
         
-        # Get kernel messages with timestamps (relative to boot)
-        result = subprocess.run(["dmesg", "-T"], capture_output=True, text=True, timeout=30)
-        
-        if result.returncode == 0:
-            with open(kernel_log_file, "w", encoding="utf-8") as f:
-                f.write("=" * 80 + "\n")
-                f.write(f"Kernel Messages (dmesg) Capture\n")
-                f.write(f"Captured: {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(result.stdout)
-            
-            # Count link-related messages
-            link_messages = [line for line in result.stdout.splitlines() if "link" in line.lower() or "carrier" in line.lower()]
-            
-            log_msg(f"[SUCCESS] Kernel messages captured: {kernel_log_file}", None)
-            log_msg(f"[INFO] Found {len(link_messages)} link-related kernel messages.", None)
-            
-            return kernel_log_file
-        else:
-            log_msg(f"[ERROR] Failed to capture kernel messages: {result.stderr}", None)
-            return ""
+        # Get kernel messages with timestamps (relative to boot). dmesg writes
+        # straight into a temp file, so the buffer is never held in memory;
+        # run() reads stderr alongside and kills dmesg at the deadline.
+        header = (
+            "=" * 80 + "\n"
+            "Kernel Messages (dmesg) Capture\n"
+            f"Captured: {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}\n"
+            + "=" * 80 + "\n\n"
+        ).encode("utf-8")
+        try:
+            with open(temp_file, "w+b") as f:
+                f.write(header)
+                f.flush()
+                result = subprocess.run(["dmesg", "-T"], stdout=f, stderr=subprocess.PIPE, timeout=30)
+                if result.returncode != 0:
+                    log_msg(f"[ERROR] Failed to capture kernel messages: {_output_text(result.stderr)}", None)
+                    return ""
+                
+                # Count link-related messages, streaming back over what dmesg wrote
+                f.seek(len(header))
+                link_count = 0
+                for line in f:
+                    low = line.lower()
+                    if b"link" in low or b"carrier" in low:
+                        link_count += 1
+            # Only a complete capture replaces the log; failures leave any
+            # previous one untouched
+            os.replace(temp_file, kernel_log_file)
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+        log_msg(f"[SUCCESS] Kernel messages captured: {kernel_log_file}", None)
+        log_msg(f"[INFO] Found {link_count} link-related kernel messages.", None)
+        return kernel_log_file
     except FileNotFoundError:
         log_msg("[ERROR] dmesg command not found.", None)
         return ""
@@ -1163,11 +1510,18 @@ def capture_kernel_messages(output_file: str) -> str:
         return ""
 
 
-def collect_amber_data(device: str, port: Optional[int] = None, output_file: str = "amber_data.csv", if_map: Optional[Dict[str, Dict[str, str]]] = None) -> str:
-    """Collect amBER data using mlxlink and save to CSV file. Returns final filename with link and interface name."""
+def collect_amber_data(device: str, port: Optional[int] = None, output_file: str = "amber_data.csv", if_map: Optional[Dict[str, Dict[str, str]]] = None) -> Tuple[str, List[CsvRow]]:
+    """
+    Collect amBER data using mlxlink and save to CSV file.
+    Returns (final filename with link and interface name, parsed rows), or
+    ("", []) on failure. The CSV is parsed once here and the rows are reused
+    for naming and reporting.
+    """
+    import subprocess
     try:
         # Create temporary filename first
-        temp_file = output_file.replace(".csv", "_temp.csv")
+        base_name = output_file[:-4] if output_file.endswith(".csv") else output_file
+        temp_file = base_name + "_temp.csv"
         
         cmd = ["mlxlink", "-d", device]
         if port is not None:
@@ -1177,20 +1531,24 @@ def collect_amber_data(device: str, port: Optional[int] = None, output_file: str
         cmd.extend(["--amber_collect", temp_file])
         
         log_msg(f"[INFO] Collecting amBER data from {device}" + (f" port {port}" if port else ""), None)
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        result = subprocess.run(cmd, capture_output=True, timeout=120)
         
         if result.returncode == 0:
             if os.path.exists(temp_file):
-                # Read CSV to get link name
-                link_name = get_link_name_from_csv(temp_file)
-                
-                # Get interface name from MAC mapping if available
+                try:
+                    rows = read_csv_safely(temp_file)
+                except Exception:
+                    rows = []
+
+                # Link name and interface name (via MAC mapping) from the first row
+                link_name = ""
                 interface_name = ""
-                if if_map:
-                    interface_name = get_interface_name_from_csv(temp_file, if_map)
+                if rows:
+                    link_name = get_link_name_from_row(rows[0])
+                    if if_map:
+                        interface_name = get_interface_name_from_row(rows[0], if_map)
                 
                 # Create final filename with link name and interface name
-                base_name = output_file.replace(".csv", "")
                 parts = [base_name]
                 
                 if link_name:
@@ -1201,38 +1559,117 @@ def collect_amber_data(device: str, port: Optional[int] = None, output_file: str
                 
                 final_file = "_".join(parts) + ".csv"
                 
-                # Rename temp file to final filename
+                # Rename temp file to final filename (overwriting a previous collection)
                 if final_file != temp_file:
-                    os.rename(temp_file, final_file)
-                else:
-                    # If same name, just rename temp
-                    if temp_file != output_file:
-                        os.rename(temp_file, output_file)
-                        final_file = output_file
+                    os.replace(temp_file, final_file)
                 
                 log_msg(f"[SUCCESS] amBER data collected and saved to: {final_file}", None)
-                return final_file
+                return final_file, rows
             else:
                 log_msg(f"[ERROR] mlxlink completed but file not created: {temp_file}", None)
-                return ""
+                return "", []
         else:
             log_msg(f"[ERROR] mlxlink failed. Try running manually:", None)
             log_msg(f"  mlxlink -d {device}" + (f" -p {port}" if port else "") + f" --amber_collect {output_file}", None)
             if result.stderr:
-                log_msg(f"  Error: {result.stderr}", None)
-            return ""
+                log_msg(f"  Error: {_output_text(result.stderr)}", None)
+            return "", []
     except FileNotFoundError:
         log_msg("[ERROR] mlxlink not found. Please install Mellanox Firmware Tools (MFT).", None)
-        return ""
+        return "", []
     except subprocess.TimeoutExpired:
         log_msg("[ERROR] mlxlink command timed out.", None)
-        return ""
+        return "", []
     except Exception as e:
         log_msg(f"[ERROR] Failed to collect amBER data: {e}", None)
-        return ""
+        return "", []
+
+
+def _collect_from_device(
+    device: str,
+    port: Optional[int],
+    output_prefix: str,
+    if_map: Dict[str, Dict[str, str]],
+) -> Tuple[str, List[CsvRow]]:
+    """Collect amBER data from one MST device and capture kernel messages for it."""
+    device_name = os.path.basename(device).replace("pciconf", "").replace("_", "")
+    output_file = f"{output_prefix}_{device_name}.csv"
+
+    final_file, rows = collect_amber_data(device, port, output_file, if_map)
+    if final_file:
+        # Capture kernel messages for each device
+        capture_kernel_messages(final_file)
+    else:
+        log_msg(f"[WARN] Failed to collect from {device}, continuing...", None)
+    return final_file, rows
+
+
+def _handle_one(
+    path: str,
+    if_map: Dict[str, Dict[str, str]],
+    all_fields: bool = False,
+    rows: Optional[List[CsvRow]] = None,
+) -> Tuple[str, Any]:
+    """
+    Process one input file into its own log; main() has already created the
+    log's directory. `rows` are the already-parsed rows of a file collected
+    in this run, if any. Returns (kind, detail):
+    ("processed", row_count), ("template", None), ("error", message) or
+    ("", None) when there is nothing to report.
+    """
+    log_path = f"{path}.log"
+    outcome: Tuple[str, Any] = ("", None)
+    try:
+        # Large buffer: the with-block's close() flushes it, so per-line
+        # durability isn't needed and row reports coalesce into few writes
+        with open(log_path, "w", encoding="utf-8", buffering=1 << 20) as logf:
+            log_msg(f"[INFO] Processing: {path}", logf)
+            log_msg(f"[INFO] Log file: {log_path}", logf)
+            
+            if rows is not None:
+                # Just collected: rows are already parsed
+                res = process_rows(rows, os.path.abspath(path), logf, if_map, all_fields)
+            else:
+                res = process_file(path, logf, if_map, all_fields)
+            
+            # Track what happened
+            if res.error:
+                outcome = ("error", res.error)
+            elif res.had_data:
+                outcome = ("processed", res.row_count)
+            else:
+                # New template, or an existing file with headers only
+                outcome = ("template", None)
+            
+            log_msg("[INFO] Done.", logf)
+    except Exception as e:
+        error_msg = f"Failed to process {path}: {e}"
+        log_msg(f"[ERROR] {error_msg}", None)
+        outcome = ("error", error_msg)
+    return outcome
+
+
+def _init_file_worker() -> None:
+    """Per-file pool initializer: rows are formatted in-process, not in a nested pool."""
+    global _ROW_POOL_ENABLED
+    _ROW_POOL_ENABLED = False
+
+
+def _handle_one_captured(handle: Callable[..., Tuple[str, Any]], path: str, rows: Optional[List[CsvRow]]) -> Tuple[str, Tuple[str, Any]]:
+    """Pool entry point: run `handle` with stdout captured so the parent can replay it in order."""
+    import contextlib
+    import io
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        result = handle(path, rows=rows)
+    return buf.getvalue(), result
 
 
-def main():
+def main() -> None:
+    import contextlib
+    from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
     parser = argparse.ArgumentParser(
         description="Summarize NVIDIA amBER CSV output into human-readable link health reports.",
         epilog="Examples:\n"
@@ -1264,6 +1701,11 @@ def main():
         default="amber_data.csv",
         help="Output CSV filename prefix when using --collect option (default: amber_data.csv)"
     )
+    parser.add_argument(
+        "--all-fields",
+        action="store_true",
+        help="Append every non-empty CSV field (raw data dump) to each row report"
+    )
     parser.add_argument(
         "--install-mst",
         action="store_true",
@@ -1284,11 +1726,18 @@ def main():
             log_msg("[INFO] Starting MST after installation...", None)
             start_mst()
     
-    # Build host MAC -> interface map once (before collecting data so we can use it in filenames)
-    if_map = get_local_if_map()
-    if if_map:
-        log_msg(f"[INFO] Found {len(if_map)} local interface(s) for MAC mapping.", None)
+    # Build host MAC -> interface map once. Collection needs it up front for
+    # the output filenames; otherwise it is built alongside pattern expansion.
+    if_map: Dict[str, Dict[str, str]] = {}
+    if args.collect:
+        if_map = get_local_if_map()
+        if if_map:
+            log_msg(_IF_MAP_MSG % len(if_map), None)
     
+    # Rows parsed during collection, keyed by output path, so freshly
+    # collected files are not read back from disk again
+    collected_rows: Dict[str, List[CsvRow]] = {}
+
     # If --collect is used, collect data first
     if args.collect:
         collected_files = []
@@ -1311,17 +1760,19 @@ def main():
             
             log_msg(f"[INFO] Found {len(devices)} MST device(s), collecting amBER data from all...", None)
             
-            for device in devices:
-                device_name = os.path.basename(device).replace("pciconf", "").replace("_", "")
-                output_file = f"{args.output.replace('.csv', '')}_{device_name}.csv"
-                
-                final_file = collect_amber_data(device, args.port, output_file, if_map)
+            # mlxlink runs are independent and mostly waiting on the device,
+            # so collect from all devices concurrently; keep device order.
+            output_prefix = args.output.replace('.csv', '')
+            with ThreadPoolExecutor(max_workers=min(_MAX_COLLECT_WORKERS, len(devices))) as ex:
+                futures = [
+                    ex.submit(_collect_from_device, device, args.port, output_prefix, if_map)
+                    for device in devices
+                ]
+            for future in futures:
+                final_file, rows = future.result()
                 if final_file:
                     collected_files.append(final_file)
-                    # Capture kernel messages for each device
-                    kernel_log = capture_kernel_messages(final_file)
-                else:
-                    log_msg(f"[WARN] Failed to collect from {device}, continuing...", None)
+                    collected_rows[final_file] = rows
             
             if not collected_files:
                 log_msg("[ERROR] Failed to collect data from any device.", None)
@@ -1354,10 +1805,11 @@ def main():
                     log_msg("  (none - MST may not be running)", None)
                 return
             
-            final_file = collect_amber_data(args.collect, args.port, args.output, if_map)
+            final_file, rows = collect_amber_data(args.collect, args.port, args.output, if_map)
             if not final_file:
                 return
             collected_files = [final_file]
+            collected_rows[final_file] = rows
             # Capture kernel messages for this device
             kernel_log = capture_kernel_messages(final_file)
         
@@ -1370,118 +1822,141 @@ def main():
     if not args.files:
         parser.error("Either provide CSV files or use --collect option to gather data.")
 
-    # Expand wildcard patterns
-    file_paths = expand_file_patterns(args.files)
+    # Expand wildcard patterns. Without --collect the interface map is still
+    # to be built; both are independent filesystem work, so overlap them.
+    if args.collect:
+        file_paths = tuple(expand_file_patterns(args.files))
+    else:
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            if_map_future = ex.submit(get_local_if_map)
+            file_paths = tuple(expand_file_patterns(args.files))
+            if_map = if_map_future.result()
     
     if not file_paths:
         log_msg("[ERROR] No files found matching the pattern.", None)
         return
 
-    # if_map already built above if --collect was used, otherwise build it now
-    if not args.collect:
-        if_map = get_local_if_map()
-        if if_map:
-            log_msg(f"[INFO] Found {len(if_map)} local interface(s) for MAC mapping.", None)
+    if if_map and not args.collect:
+        log_msg(_IF_MAP_MSG % len(if_map), None)
 
     # Summary tracking
-    processed_files = []
-    created_templates = []
-    errors = []
+    # Entries refer to files by their index in file_paths
+    processed_files = []    # (index, row_count)
+    created_templates = []  # index
+    errors = []             # (index, message)
     kernel_logs = []
 
     log_msg(f"[INFO] Processing {len(file_paths)} file(s)...", None)
     log_msg("", None)
     
-    # Capture kernel messages once at the start (for all files)
-    if file_paths:
-        # Use first file's name as base for kernel log
-        first_file = file_paths[0]
-        kernel_log = capture_kernel_messages(first_file)
-        if kernel_log:
-            kernel_logs.append(kernel_log)
-
+    # Ensure log directories exist, once per distinct directory (batches
+    # usually share one)
+    made_dirs = set()
     for path in file_paths:
-        log_path = f"{path}.log"
-        # Ensure log directory exists
-        log_dir = os.path.dirname(log_path)
-        if log_dir and not os.path.exists(log_dir):
+        log_dir = os.path.dirname(path)
+        if log_dir and log_dir not in made_dirs:
+            made_dirs.add(log_dir)
             try:
                 os.makedirs(log_dir, exist_ok=True)
-            except Exception as e:
+            except OSError as e:
                 log_msg(f"[WARN] Could not create log directory {log_dir}: {e}", None)
-        
-        try:
-            with open(log_path, "w", encoding="utf-8") as logf:
-                log_msg(f"[INFO] Processing: {path}", logf)
-                log_msg(f"[INFO] Log file: {log_path}", logf)
-                
-                # Check if file exists before processing
-                file_existed = os.path.exists(path)
-                process_file(path, logf, if_map)
-                
-                # Track what happened
-                if not file_existed and os.path.exists(path):
-                    created_templates.append(path)
-                elif file_existed:
-                    # Check if it had data
-                    try:
-                        rows = read_csv_safely(path)
-                        if rows:
-                            processed_files.append((path, log_path, len(rows)))
-                        else:
-                            created_templates.append(path)
-                    except:
-                        processed_files.append((path, log_path, 0))
-                
-                log_msg("[INFO] Done.", logf)
-        except Exception as e:
-            error_msg = f"Failed to process {path}: {e}"
-            log_msg(f"[ERROR] {error_msg}", None)
-            errors.append((path, error_msg))
 
-    # Print summary
-    log_msg("", None)
-    log_msg("=" * 80, None)
-    log_msg("PROCESSING SUMMARY", None)
-    log_msg("=" * 80, None)
+    # Capture kernel messages once for all files, named after the first one.
+    # It mostly waits on dmesg, so it runs on a background thread while the
+    # files are processed. Forking while that thread holds a lock would copy
+    # the lock, held, into the child, so the thread starts only once nothing
+    # more will fork.
+    handle = partial(_handle_one, if_map=if_map, all_fields=args.all_fields)
+    workers = min(os.cpu_count() or 1, len(file_paths), _MAX_FILE_WORKERS)
+    row_pools = _ROW_POOL_ENABLED and min(os.cpu_count() or 1, _MAX_REPORT_WORKERS) > 1
+    with ThreadPoolExecutor(max_workers=1) as kernel_pool, contextlib.ExitStack() as stack:
+        pending: Optional[Iterable[Tuple[str, Tuple[str, Any]]]] = None
+        if workers > 1:
+            # Files are independent: each worker writes its own log and hands
+            # back its console output, which is replayed here in file order.
+            # map() submits every file, so the workers exist once it returns.
+            try:
+                file_pool = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=workers, initializer=_init_file_worker))
+                pending = file_pool.map(partial(_handle_one_captured, handle), file_paths,
+                                        [collected_rows.get(p) for p in file_paths])
+            except OSError as e:
+                log_msg(f"[WARN] Could not use a process pool ({e}); processing files sequentially.", None)
+                pending = None
+        if pending is None and row_pools:
+            # Handled inline, printing as they go; large files may fork row
+            # pools, so these run before the capture starts
+            pending = [("", handle(path, rows=collected_rows.get(path))) for path in file_paths]
+
+        kernel_future: "Future[str]" = kernel_pool.submit(capture_kernel_messages, file_paths[0])
+        if pending is None:
+            # Handled inline without forking, alongside the capture
+            pending = (("", handle(path, rows=collected_rows.get(path))) for path in file_paths)
+        results = []
+        try:
+            for console, result in pending:
+                sys.stdout.write(console)
+                results.append(result)
+        except BrokenProcessPool as e:
+            # Files already replayed keep their results; the rest were never
+            # reported, so running them inline repeats nothing
+            log_msg(f"[WARN] Could not use a process pool ({e}); processing remaining files sequentially.", None)
+            # Let the capture finish so row pools below don't fork under it
+            kernel_future.result()
+            results.extend(handle(path, rows=collected_rows.get(path))
+                           for path in file_paths[len(results):])
+        kernel_log = kernel_future.result()
+
+    if kernel_log:
+        kernel_logs.append(kernel_log)
+
+    for i, (kind, detail) in enumerate(results):
+        if kind == "processed":
+            processed_files.append((i, detail))
+        elif kind == "template":
+            created_templates.append(i)
+        elif kind == "error":
+            errors.append((i, detail))
+
+    # Print summary, built up and written in one go
+    out = ["", "=" * 80, "PROCESSING SUMMARY", "=" * 80]
     
     if processed_files:
-        log_msg(f"[SUCCESS] Processed {len(processed_files)} file(s) with data:", None)
-        for file_path, log_path, row_count in processed_files:
-            log_msg(f"  ✓ {file_path} -> {log_path} ({row_count} row(s))", None)
-        log_msg("", None)
-        log_msg("  View detailed logs:", None)
-        for file_path, log_path, _ in processed_files:
-            log_msg(f"    cat {log_path}", None)
+        out.append(f"[SUCCESS] Processed {len(processed_files)} file(s) with data:")
+        # One pass fills both listings
+        views = ["", "  View detailed logs:"]
+        for i, row_count in processed_files:
+            path = file_paths[i]
+            out.append("  ✓ %s -> %s.log (%d row(s))" % (path, path, row_count))
+            views.append("    cat %s.log" % path)
+        out.extend(views)
     
     if created_templates:
-        log_msg(f"[INFO] Created {len(created_templates)} template file(s):", None)
-        for file_path in created_templates:
-            log_msg(f"  • {file_path} (template with headers only)", None)
-        log_msg("", None)
-        log_msg("  These are template files. Add data rows to generate detailed reports.", None)
+        out.append(f"[INFO] Created {len(created_templates)} template file(s):")
+        out.extend("  • %s (template with headers only)" % file_paths[i] for i in created_templates)
+        out.append("")
+        out.append("  These are template files. Add data rows to generate detailed reports.")
     
     if errors:
-        log_msg(f"[ERROR] {len(errors)} file(s) had errors:", None)
-        for file_path, error_msg in errors:
-            log_msg(f"  ✗ {file_path}: {error_msg}", None)
+        out.append(f"[ERROR] {len(errors)} file(s) had errors:")
+        out.extend("  ✗ %s: %s" % (file_paths[i], error_msg) for i, error_msg in errors)
     
     if kernel_logs:
-        log_msg("", None)
-        log_msg(f"[INFO] Kernel messages captured in {len(kernel_logs)} file(s):", None)
-        for kernel_log in kernel_logs:
-            log_msg(f"  • {kernel_log}", None)
-        log_msg("", None)
-        log_msg("  View kernel messages:", None)
+        out.append("")
+        out.append(f"[INFO] Kernel messages captured in {len(kernel_logs)} file(s):")
+        # One pass fills all three listings
+        views = ["", "  View kernel messages:"]
+        greps = ["", "  Search for link events in kernel logs:"]
         for kernel_log in kernel_logs:
-            log_msg(f"    cat {kernel_log}", None)
-        log_msg("", None)
-        log_msg("  Search for link events in kernel logs:", None)
-        for kernel_log in kernel_logs:
-            log_msg(f"    grep -i 'link' {kernel_log}", None)
+            out.append("  • %s" % kernel_log)
+            views.append("    cat %s" % kernel_log)
+            greps.append("    grep -i 'link' %s" % kernel_log)
+        out.extend(views)
+        out.extend(greps)
     
-    log_msg("", None)
-    log_msg("=" * 80, None)
+    out.append("")
+    out.append("=" * 80)
+    log_lines(out, None)
 
 
 if __name__ == "__main__":